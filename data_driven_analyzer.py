@@ -274,10 +274,10 @@ class DataDrivenAnalyzer:
         print(f"   📊 {len(self.processed_data)} survey responses → {len(product_groups)} unique products")
         
         # Create scatter plot - one point per product at average coordinates
-        for product_name, row in product_groups.iterrows():
-            avg_x = row[x_dimension]
-            avg_y = row[y_dimension] 
-            frequency = row['frequency']
+        for product_name, avg_x, avg_y, frequency in zip(product_groups.index,
+                                                        product_groups[x_dimension].to_numpy(),
+                                                        product_groups[y_dimension].to_numpy(),
+                                                        product_groups['frequency'].to_numpy()):
             
             # Get brand color (extract brand from product name)
             brand = product_name.split()[0] if ' ' in product_name else product_name
@@ -388,7 +388,7 @@ class DataDrivenAnalyzer:
     
     def _add_smart_labels_with_leaders(self, ax, x_dimension, y_dimension, brand_colors):
         """Add smart labels with leader lines (adapted from original version)."""
-        for _, row in self.processed_data.iterrows():
+        for row in self.processed_data.to_dict('records'):
             popularity = row.get('popularity', 50)
             bubble_size = self._calculate_bubble_size(popularity)
             
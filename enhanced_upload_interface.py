@@ -19,9 +19,14 @@ Usage:
 """
 
 import os
+import re
 import json
+import hashlib
+from io import BytesIO
 import pandas as pd
+import numpy as np
 from flask import Flask, render_template, request, jsonify, session, redirect, url_for, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.utils import secure_filename
 import tempfile
 import uuid
@@ -29,12 +34,81 @@ from datetime import datetime
 from typing import Dict, List, Optional
 import threading
 import time
+import logging
+from concurrent.futures import TimeoutError as FutureTimeoutError
 
 from data_upload_system import DataUploadSystem, ValidationResult
-from genai_integration import GenAIExtractor
+from genai_integration import GenAIExtractor, BatchedExtractor
+
+try:
+    from waitress import serve
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    class OrjsonProvider(DefaultJSONProvider):
+        """Flask JSON provider backed by orjson; jsonify() calls are unchanged."""
+        
+        def dumps(self, obj, **kwargs) -> str:
+            return orjson.dumps(
+                obj,
+                default=self.default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            ).decode('utf-8')
+        
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+# Content-addressed copies of generated maps, safe to cache indefinitely
+MAPS_DIR = os.path.join('results', 'maps')
+MAP_CACHE_CONTROL = 'public, max-age=86400, immutable'
+
+# Column names that identify the rated product, in priority order
+PRODUCT_KEYWORDS = (
+    'product_name', 'product', 'phone_model', 'model', 'brand',
+    'item', 'name', 'smartphone', 'mobile', 'device', 'company',
+    'manufacturer', 'service', 'option', 'choice', 'alternative',
+    'solution', 'app', 'software', 'platform', 'tool', 'system',
+    'website', 'car', 'vehicle'
+)
+PRODUCT_KEYWORDS_INDEX = pd.Index(PRODUCT_KEYWORDS)
+# ASCII-only case folding inside the matcher, so column names need no lower() copy
+PRODUCT_KEYWORDS_RE = re.compile('|'.join(map(re.escape, PRODUCT_KEYWORDS)), re.IGNORECASE | re.ASCII)
+
+# dtype names select_dtypes(include=['object', 'string']) matches ('str' is pandas 3's default)
+TEXT_DTYPE_NAMES = ('object', 'str', 'string')
+
+def find_product_column(df):
+    """Find the most likely product name column, or None."""
+    # First, try exact matches; masking the keywords (not the columns) keeps
+    # keyword order deciding between several hits
+    is_present = PRODUCT_KEYWORDS_INDEX.isin(df.columns)
+    if is_present.any():
+        return PRODUCT_KEYWORDS[is_present.argmax()]
+    
+    # Then try partial matches, one case-insensitive regex search per column
+    for col in df.columns:
+        if PRODUCT_KEYWORDS_RE.search(col):
+            return col
+    
+    # Finally, take the first string column if available
+    is_text = np.isin(df.dtypes.values.astype(str), TEXT_DTYPE_NAMES)
+    if is_text.any():
+        return df.columns[is_text.argmax()]
+    
+    return None
 
 app = Flask(__name__)
 app.secret_key = os.urandom(24)  # Random secret key for sessions
+if ORJSON_AVAILABLE:
+    app.json = OrjsonProvider(app)
 
 class EnhancedUploadInterface:
     """Web-based upload interface with real-time features."""
@@ -42,6 +116,7 @@ class EnhancedUploadInterface:
     def __init__(self):
         self.upload_system = DataUploadSystem()
         self.genai_extractor = GenAIExtractor()
+        self.batched_extractor = BatchedExtractor(self.genai_extractor)
         self.active_sessions = {}
         
         # Configure Flask app
@@ -226,14 +301,19 @@ def extract_keywords():
         if not session_id:
             return jsonify({'error': 'No active session'}), 400
         
-        # Run extraction
-        result = interface.genai_extractor.extract_keywords(
+        # Run extraction (concurrent requests are coalesced into one API call)
+        future = interface.batched_extractor.submit(
             qualitative_text=qualitative_text,
             industry_context=industry_context,
             service=service,
             api_key=api_key
         )
         
+        try:
+            result = future.result(timeout=60)
+        except FutureTimeoutError:
+            return jsonify({'error': 'Keyword extraction timed out'}), 504
+        
         return jsonify({
             'success': result.success,
             'keywords': result.keywords,
@@ -265,36 +345,6 @@ def generate_analysis():
         # Convert to DataFrame
         df = pd.DataFrame(data['quantitative_data'])
         
-        # Fix column naming for compatibility - flexible product name detection
-        def find_product_column(df):
-            """Find the most likely product name column."""
-            product_keywords = [
-                'product_name', 'product', 'phone_model', 'model', 'brand', 
-                'item', 'name', 'smartphone', 'mobile', 'device', 'company',
-                'manufacturer', 'service', 'option', 'choice', 'alternative',
-                'solution', 'app', 'software', 'platform', 'tool', 'system',
-                'website', 'car', 'vehicle'
-            ]
-            
-            # First, try exact matches
-            for keyword in product_keywords:
-                if keyword in df.columns:
-                    return keyword
-            
-            # Then try partial matches
-            for col in df.columns:
-                col_lower = col.lower()
-                for keyword in product_keywords:
-                    if keyword in col_lower:
-                        return col
-            
-            # Finally, take the first string column if available
-            string_cols = df.select_dtypes(include=['object', 'string']).columns.tolist()
-            if string_cols:
-                return string_cols[0]
-            
-            return None
-        
         # Rename the product column to phone_model for analyzer compatibility
         product_col = find_product_column(df)
         if product_col and product_col != 'phone_model':
@@ -412,29 +462,31 @@ def create_map():
         if y_dimension not in valid_dimensions:
             return jsonify({'error': f'Y dimension "{y_dimension}" not found in valid dimensions: {valid_dimensions}'}), 400
         
-        # Generate unique filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{x_dimension}_vs_{y_dimension}_{timestamp}.png"
-        filepath = os.path.join('results', filename)
-        
-        # Ensure results directory exists
-        os.makedirs('results', exist_ok=True)
-        
         # Create map using data-driven analyzer
         import matplotlib.pyplot as plt
         
-        fig, ax = analyzer.create_perceptual_map(
-            x_dimension, 
-            y_dimension,
-            save_path=filepath
-        )
+        fig, ax = analyzer.create_perceptual_map(x_dimension, y_dimension)
         
+        # Render in memory; only the content-addressed copy is written to disk
+        buffer = BytesIO()
+        fig.savefig(buffer, format='png', dpi=300, bbox_inches='tight', facecolor='white')
         plt.close(fig)  # Close figure to prevent display issues
+        png_bytes = buffer.getvalue()
+        
+        # Identical maps share one file and URL so browsers can reuse the cached image
+        digest = hashlib.sha1(png_bytes).hexdigest()
+        filename = f'{digest}.png'
+        
+        os.makedirs(MAPS_DIR, exist_ok=True)
+        content_path = os.path.join(MAPS_DIR, filename)
+        if not os.path.exists(content_path):
+            with open(content_path, 'wb') as f:
+                f.write(png_bytes)
         
         return jsonify({
             'success': True,
             'map_file': filename,
-            'map_url': f'/view_map/{filename}',
+            'map_url': f'/maps/{digest}.png',
             'message': f'Map created: {x_dimension} vs {y_dimension}'
         })
         
@@ -449,6 +501,17 @@ def view_map(filename):
     except FileNotFoundError:
         return "Map not found", 404
 
+@app.route('/maps/<digest>.png')
+def view_map_by_digest(digest):
+    """Serve a content-addressed map image with long-lived cache headers."""
+    try:
+        response = send_from_directory(MAPS_DIR, f'{digest}.png')
+    except FileNotFoundError:
+        return "Map not found", 404
+    
+    response.headers['Cache-Control'] = MAP_CACHE_CONTROL
+    return response
+
 @app.route('/list_maps')
 def list_maps():
     """List all available generated maps."""
@@ -457,16 +520,22 @@ def list_maps():
         if not os.path.exists(results_dir):
             return jsonify({'maps': []})
         
+        # Maps saved by scripts sit in results/; web-created maps in MAPS_DIR
+        sources = [(results_dir, '/view_map/'), (MAPS_DIR, '/maps/')]
+        
         maps = []
-        for filename in os.listdir(results_dir):
-            if filename.endswith('.png'):
-                filepath = os.path.join(results_dir, filename)
-                stats = os.stat(filepath)
-                maps.append({
-                    'filename': filename,
-                    'created': datetime.fromtimestamp(stats.st_ctime).strftime('%Y-%m-%d %H:%M:%S'),
-                    'url': f'/view_map/{filename}'
-                })
+        for directory, url_prefix in sources:
+            if not os.path.isdir(directory):
+                continue
+            for filename in os.listdir(directory):
+                if filename.endswith('.png'):
+                    filepath = os.path.join(directory, filename)
+                    stats = os.stat(filepath)
+                    maps.append({
+                        'filename': filename,
+                        'created': datetime.fromtimestamp(stats.st_ctime).strftime('%Y-%m-%d %H:%M:%S'),
+                        'url': f'{url_prefix}{filename}'
+                    })
         
         # Sort by creation time, most recent first
         maps.sort(key=lambda x: x['created'], reverse=True)
@@ -507,6 +576,12 @@ UPLOAD_TEMPLATE = """
         .keyword-list { display: flex; flex-wrap: wrap; gap: 5px; margin: 10px 0; }
         .keyword-tag { background: #e3f2fd; padding: 5px 10px; border-radius: 15px; font-size: 0.9em; }
         .analysis-summary { background: #f0f8ff; padding: 15px; border-radius: 8px; margin: 10px 0; }
+        .dimension-picker { margin: 5px 0; }
+        .dimension-listbox { position: relative; height: 224px; overflow-y: auto; border: 1px solid #ddd; border-radius: 4px; }
+        .dimension-spacer { position: relative; }
+        .dimension-option { position: absolute; left: 0; right: 0; height: 28px; line-height: 28px; padding: 0 10px; cursor: pointer; white-space: nowrap; overflow: hidden; }
+        .dimension-option:hover { background: #f5f5f5; }
+        .dimension-option.selected { background: #e3f2fd; font-weight: bold; }
     </style>
 </head>
 <body>
@@ -606,6 +681,55 @@ UPLOAD_TEMPLATE = """
     </div>
     
     <script>
+        // Identical requests (e.g. double clicks) share one in-flight/recent promise
+        const _pending = new Map();
+        const DEDUPE_TTL_MS = 30000;
+
+        async function requestKey(url, body) {
+            // Credentials never become part of the cache key
+            const {api_key, ...keyed} = body;
+            const text = url + ' ' + JSON.stringify(keyed);
+            if (!window.crypto || !window.crypto.subtle) {
+                return text;
+            }
+            const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(text));
+            return Array.from(new Uint8Array(digest), b => b.toString(16).padStart(2, '0')).join('');
+        }
+
+        async function dedupedFetch(url, body) {
+            const key = await requestKey(url, body);
+            if (_pending.has(key)) {
+                return _pending.get(key);
+            }
+
+            const forget = () => {
+                if (_pending.get(key) === promise) {
+                    _pending.delete(key);
+                }
+            };
+            const promise = fetch(url, {
+                method: 'POST',
+                headers: {'Content-Type': 'application/json'},
+                body: JSON.stringify(body)
+            })
+            .then(response => response.json())
+            .then(data => {
+                // Only successful responses are worth reusing
+                if (data.success) {
+                    setTimeout(forget, DEDUPE_TTL_MS);
+                } else {
+                    forget();
+                }
+                return data;
+            }, error => {
+                forget();
+                throw error;
+            });
+
+            _pending.set(key, promise);
+            return promise;
+        }
+
         // Real-time text validation
         document.getElementById('qualitative-text').addEventListener('input', function() {
             const text = this.value;
@@ -717,6 +841,104 @@ UPLOAD_TEMPLATE = """
             document.getElementById('generate-analysis-btn').disabled = false;
         }
         
+        // Dimension pickers: a plain <select> for typical dimension counts,
+        // a searchable windowed listbox (only visible rows in the DOM) for large sets
+        const VIRTUAL_DIMENSION_THRESHOLD = 200;
+        const DIMENSION_ROW_HEIGHT = 28;
+        const DIMENSION_VISIBLE_ROWS = 8;
+
+        function escapeHtml(text) {
+            return String(text).replace(/[&<>"']/g, c => ({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}[c]));
+        }
+
+        function populateDimensionSelect(selectId, dimensions) {
+            const select = document.getElementById(selectId);
+            const existingPicker = document.getElementById(selectId + '-picker');
+            if (existingPicker) {
+                existingPicker.remove();
+            }
+
+            if (dimensions.length <= VIRTUAL_DIMENSION_THRESHOLD) {
+                // Build all options in one string and attach them in a single DOM update
+                select.innerHTML = dimensions.map(dim =>
+                    '<option value="' + escapeHtml(dim) + '">' + escapeHtml(dim.replace('_', ' ')) + '</option>'
+                ).join('');
+                select.classList.remove('hidden');
+                return;
+            }
+
+            select.innerHTML = '';
+            select.classList.add('hidden');
+            select.parentNode.insertBefore(createVirtualPicker(selectId, dimensions), select.nextSibling);
+        }
+
+        function createVirtualPicker(selectId, dimensions) {
+            const picker = document.createElement('div');
+            picker.id = selectId + '-picker';
+            picker.className = 'dimension-picker';
+            picker.innerHTML =
+                '<input type="text" class="dimension-search" placeholder="Search ' + dimensions.length.toLocaleString() + ' dimensions...">' +
+                '<input type="hidden" class="dimension-value" value="' + escapeHtml(dimensions[0]) + '">' +
+                '<div class="dimension-listbox" role="listbox"><div class="dimension-spacer"></div></div>';
+
+            const search = picker.querySelector('.dimension-search');
+            const selected = picker.querySelector('.dimension-value');
+            const listbox = picker.querySelector('.dimension-listbox');
+            const spacer = picker.querySelector('.dimension-spacer');
+            let filtered = dimensions;
+            let renderPending = false;
+            let searchTimer = null;
+
+            function render() {
+                renderPending = false;
+                const start = Math.floor(listbox.scrollTop / DIMENSION_ROW_HEIGHT);
+                const visible = filtered.slice(start, start + DIMENSION_VISIBLE_ROWS + 1);
+                spacer.style.height = (filtered.length * DIMENSION_ROW_HEIGHT) + 'px';
+                spacer.innerHTML = visible.map((dim, i) =>
+                    '<div class="dimension-option' + (dim === selected.value ? ' selected' : '') + '" role="option"' +
+                    ' data-value="' + escapeHtml(dim) + '" style="top: ' + ((start + i) * DIMENSION_ROW_HEIGHT) + 'px;">' +
+                    escapeHtml(dim.replace('_', ' ')) + '</div>'
+                ).join('');
+            }
+
+            function scheduleRender() {
+                if (!renderPending) {
+                    renderPending = true;
+                    requestAnimationFrame(render);
+                }
+            }
+
+            listbox.addEventListener('scroll', scheduleRender);
+
+            // Debounce filtering so typing doesn't rebuild the list per keystroke
+            search.addEventListener('input', function() {
+                clearTimeout(searchTimer);
+                searchTimer = setTimeout(() => {
+                    const query = this.value.trim().toLowerCase();
+                    filtered = query ? dimensions.filter(dim => dim.toLowerCase().includes(query)) : dimensions;
+                    listbox.scrollTop = 0;
+                    scheduleRender();
+                }, 150);
+            });
+
+            listbox.addEventListener('click', function(e) {
+                const option = e.target.closest('.dimension-option');
+                if (option) {
+                    selected.value = option.dataset.value;
+                    search.value = option.dataset.value.replace('_', ' ');
+                    scheduleRender();
+                }
+            });
+
+            render();
+            return picker;
+        }
+
+        function getDimensionValue(selectId) {
+            const picker = document.getElementById(selectId + '-picker');
+            return picker ? picker.querySelector('.dimension-value').value : document.getElementById(selectId).value;
+        }
+
         // Setup file uploads
         setupFileUpload('qualitative-drop', 'qualitative-file', 'qualitative');
         setupFileUpload('quantitative-drop', 'quantitative-file', 'quantitative');
@@ -736,17 +958,12 @@ UPLOAD_TEMPLATE = """
             this.textContent = 'Extracting...';
             this.disabled = true;
             
-            fetch('/extract_keywords', {
-                method: 'POST',
-                headers: {'Content-Type': 'application/json'},
-                body: JSON.stringify({
-                    qualitative_text: qualitativeText,
-                    industry_context: industryContext,
-                    service: service,
-                    api_key: apiKey
-                })
+            dedupedFetch('/extract_keywords', {
+                qualitative_text: qualitativeText,
+                industry_context: industryContext,
+                service: service,
+                api_key: apiKey
             })
-            .then(response => response.json())
             .then(data => {
                 if (data.success) {
                     const keywordList = document.getElementById('keyword-list');
@@ -782,30 +999,15 @@ UPLOAD_TEMPLATE = """
             this.textContent = 'Generating...';
             this.disabled = true;
             
-            fetch('/generate_analysis', {
-                method: 'POST',
-                headers: {'Content-Type': 'application/json'},
-                body: JSON.stringify({
-                    quantitative_data: window.quantitativeData
-                })
+            dedupedFetch('/generate_analysis', {
+                quantitative_data: window.quantitativeData
             })
-            .then(response => response.json())
             .then(data => {
                 if (data.success) {
                     // Populate dimension selectors
-                    const xSelect = document.getElementById('x-dimension');
-                    const ySelect = document.getElementById('y-dimension');
-                    
-                    xSelect.innerHTML = '';
-                    ySelect.innerHTML = '';
-                    
-                    data.available_dimensions.forEach(dim => {
-                        const option1 = new Option(dim.replace('_', ' '), dim);
-                        const option2 = new Option(dim.replace('_', ' '), dim);
-                        xSelect.add(option1);
-                        ySelect.add(option2);
-                    });
-                    
+                    populateDimensionSelect('x-dimension', data.available_dimensions);
+                    populateDimensionSelect('y-dimension', data.available_dimensions);
+
                     document.getElementById('analysis-options').classList.remove('hidden');
                 } else {
                     alert('Analysis generation failed: ' + data.error);
@@ -819,8 +1021,8 @@ UPLOAD_TEMPLATE = """
         
         // Create specific map
         document.getElementById('create-map-btn').addEventListener('click', function() {
-            const xDim = document.getElementById('x-dimension').value;
-            const yDim = document.getElementById('y-dimension').value;
+            const xDim = getDimensionValue('x-dimension');
+            const yDim = getDimensionValue('y-dimension');
             
             if (xDim === yDim) {
                 alert('Please select different dimensions for X and Y axes');
@@ -830,16 +1032,11 @@ UPLOAD_TEMPLATE = """
             this.textContent = 'Creating Map...';
             this.disabled = true;
             
-            fetch('/create_map', {
-                method: 'POST',
-                headers: {'Content-Type': 'application/json'},
-                body: JSON.stringify({
-                    x_dimension: xDim,
-                    y_dimension: yDim,
-                    quantitative_data: window.quantitativeData
-                })
+            dedupedFetch('/create_map', {
+                x_dimension: xDim,
+                y_dimension: yDim,
+                quantitative_data: window.quantitativeData
             })
-            .then(response => response.json())
             .then(data => {
                 if (data.success) {
                     const results = document.getElementById('results-content');
@@ -881,8 +1078,19 @@ def setup_templates():
     os.makedirs(templates_dir, exist_ok=True)
     
     template_path = os.path.join(templates_dir, 'upload_interface.html')
-    with open(template_path, 'w', encoding='utf-8') as f:
-        f.write(UPLOAD_TEMPLATE)
+    content = UPLOAD_TEMPLATE.encode('utf-8')
+    
+    # Leave an up-to-date template alone
+    if os.path.exists(template_path):
+        with open(template_path, 'rb') as f:
+            if f.read() == content:
+                return
+    
+    # Write to a temporary file and swap it in so concurrent starts never see a partial template
+    temp_path = f"{template_path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(content)
+    os.replace(temp_path, template_path)
 
 def run_interface():
     """Run the enhanced upload interface."""
@@ -894,8 +1102,18 @@ def run_interface():
     # Setup templates
     setup_templates()
     
-    # Run Flask app
-    app.run(debug=True, host='0.0.0.0', port=8080)
+    # Serve with a threaded production WSGI server so concurrent
+    # extraction/analysis/map requests don't queue behind each other
+    if WAITRESS_AVAILABLE:
+        # waitress announces "Serving on http://..." at INFO, which the root
+        # level set in genai_integration would otherwise swallow; launchers
+        # such as run_with_playwright.py wait for that line
+        logging.getLogger('waitress').setLevel(logging.INFO)
+        serve(app, host='0.0.0.0', port=8080, threads=8, connection_limit=200)
+    else:
+        print("⚠️  waitress not installed - falling back to Flask's threaded server")
+        print("   Install with: pip install waitress")
+        app.run(host='0.0.0.0', port=8080, threaded=True)
 
 if __name__ == "__main__":
     run_interface()
\ No newline at end of file
@@ -17,16 +17,45 @@ Usage:
     
     extractor = GenAIExtractor()
     keywords = extractor.extract_keywords(text, context, service='openai', api_key=key)
+    
+    # Coalesce concurrent requests (e.g. from a web server) into batched calls
+    batcher = BatchedExtractor(extractor)
+    future = batcher.submit(text, context, service='openai', api_key=key)
+    keywords = future.result(timeout=60)
 """
 
 import os
+import re
+import ctypes
+import functools
 import json
+import queue
+import hashlib
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 import time
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Tuple
+from dataclasses import dataclass, replace
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import tiktoken
+    _TOKEN_ENCODING = tiktoken.get_encoding('cl100k_base')
+    TIKTOKEN_AVAILABLE = True
+except Exception:
+    # Missing package or encoding files that cannot be fetched offline
+    _TOKEN_ENCODING = None
+    TIKTOKEN_AVAILABLE = False
+
 # Disable logging for security
 logging.getLogger().setLevel(logging.CRITICAL)
 
@@ -38,6 +67,123 @@ class ExtractionResult:
     message: str
     processing_time: float = 0.0
 
+class ServiceError(Exception):
+    """Raised when a GenAI service responds with a non-success status."""
+
+def _make_session() -> requests.Session:
+    """HTTP session whose pooled keep-alive connections are reused across API calls."""
+    session = requests.Session()
+    # Room for one connection per BatchedExtractor worker and service host
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({'Accept': 'application/json'})
+    return session
+
+_SESSION = _make_session()
+
+def _post_json(url: str, data: Dict[str, Any], headers: Optional[Dict[str, str]] = None,
+               timeout: int = 30) -> requests.Response:
+    """POST a JSON body, serialized with orjson when it is installed."""
+    if not ORJSON_AVAILABLE:
+        return _SESSION.post(url, headers=headers, json=data, timeout=timeout)
+    
+    headers = {**(headers or {}), 'Content-Type': 'application/json'}
+    return _SESSION.post(url, headers=headers, data=orjson.dumps(data), timeout=timeout)
+
+def _response_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+def timed_extraction(failure_message: str):
+    """
+    Time an extraction method and turn exceptions into failed results.
+    
+    Args:
+        failure_message: Prefix for the message of results built from
+            unexpected exceptions. ServiceError messages are kept as-is.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            start_time = time.perf_counter()
+            try:
+                result = func(self, *args, **kwargs)
+            except ServiceError as e:
+                result = ExtractionResult(False, [], str(e))
+            except Exception as e:
+                result = ExtractionResult(False, [], f"{failure_message}: {str(e)}")
+            
+            result.processing_time = time.perf_counter() - start_time
+            return result
+        return wrapper
+    return decorator
+
+# Prompt budget for research text: tokens where a tokenizer is available,
+# UTF-8 bytes otherwise. UTF-8 uses at most 4 bytes per character and every
+# token covers at least one byte, so shorter strings never need measuring.
+_MAX_TEXT_TOKENS = 2500
+_MAX_TEXT_BYTES = 9000
+
+# Shared attribute requirements for single and batched extraction prompts
+_ATTRIBUTE_REQUIREMENTS = """REQUIREMENTS:
+1. Each attribute should be a measurable product characteristic
+2. Use clear, actionable attribute names (e.g., "Camera_Quality", "Battery_Life")
+3. Focus on attributes mentioned or implied by users
+4. Avoid redundant or overlapping attributes
+5. Prioritize attributes that differentiate products in this market"""
+
+# Static parts of the single-excerpt prompt; only the context, text and
+# keyword count vary between calls
+_PROMPT_PREFIX = """You are an expert in perceptual mapping and market research. Analyze the following qualitative research data to extract key product attributes/dimensions that are important to users.
+
+INDUSTRY CONTEXT:
+"""
+
+_PROMPT_MID = """
+
+QUALITATIVE RESEARCH DATA:
+"""
+
+def _zero_buffer(buffer: bytearray):
+    """Overwrite a bytearray with zeros in place."""
+    size = len(buffer)
+    if size:
+        view = (ctypes.c_char * size).from_buffer(buffer)
+        ctypes.memset(view, 0, size)
+        del view
+
+def _prompt_suffix(max_keywords: int) -> str:
+    """Build the task and format instructions for a keyword count."""
+    return f"""
+
+TASK:
+Extract exactly {max_keywords} key product attributes that users care about most. These will be used for perceptual mapping analysis.
+
+{_ATTRIBUTE_REQUIREMENTS}
+
+FORMAT YOUR RESPONSE EXACTLY AS:
+1. Attribute_Name_1
+2. Attribute_Name_2
+3. Attribute_Name_3
+...
+{max_keywords}. Attribute_Name_{max_keywords}
+
+Do not include explanations, descriptions, or additional text. Only provide the numbered list of attribute names."""
+
+# Suffixes for the keyword counts the interface and scripts use
+_SUFFIX_BY_K = {k: _prompt_suffix(k) for k in (8, 10, 12, 15, 20)}
+
+# Response line parsing: numbered items, unnumbered fallbacks and cleanup
+_NUMBERED_ITEM_RE = re.compile(r'^\d+[\.\)]\s*(.+)')
+_LEADS_WITH_DIGIT = re.compile(r'^.{0,2}\d')
+_KEYWORD_JUNK_RE = re.compile(r'[^\w\s_]')
+
+# Matches the per-excerpt headers of a batched response, e.g. "RESULT [C]:"
+_BATCH_HEADER_RE = re.compile(r'^\s*RESULT\s*\[([A-Z])\]\s*:?\s*$', re.MULTILINE | re.IGNORECASE)
+
 class GenAIExtractor:
     """Secure GenAI integration for keyword extraction."""
     
@@ -59,10 +205,22 @@ class GenAIExtractor:
         }
     }
     
-    def __init__(self):
-        """Initialize the extractor."""
-        self._active_credentials = None
+    def __init__(self, cache_size: int = 64):
+        """
+        Initialize the extractor.
+        
+        Args:
+            cache_size: Number of successful extractions to keep in memory
+        """
+        # Per-thread credential buffer, so concurrent calls never clobber each other's key
+        self._credentials_local = threading.local()
         
+        # LRU of successful results keyed by content hash (never by API key)
+        self._cache = OrderedDict()
+        self._cache_max = cache_size
+        self._cache_lock = threading.Lock()
+        
+    @timed_extraction("Extraction failed")
     def extract_keywords(self, 
                         qualitative_text: str, 
                         industry_context: str, 
@@ -82,232 +240,291 @@ class GenAIExtractor:
         Returns:
             ExtractionResult with keywords and metadata
         """
-        start_time = time.time()
+        # Validate service
+        if service not in self.SUPPORTED_SERVICES:
+            return ExtractionResult(
+                False, 
+                [], 
+                f"Unsupported service: {service}"
+            )
+        
+        # Reuse a recent result for identical input
+        cache_key = self._cache_key(qualitative_text, industry_context, service, max_keywords)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
         
         try:
-            # Store credentials temporarily
-            self._active_credentials = api_key
-            
-            # Validate service
-            if service not in self.SUPPORTED_SERVICES:
-                return ExtractionResult(
-                    False, 
-                    [], 
-                    f"Unsupported service: {service}"
-                )
+            # Store credentials temporarily in a mutable buffer we can zero
+            self._active_credentials = bytearray(api_key, 'utf-8')
             
             # Create extraction prompt
             prompt = self._create_extraction_prompt(
                 qualitative_text, 
                 industry_context, 
-                max_keywords
+                max_keywords,
+                service
             )
             
             # Call appropriate service
-            if service == 'openai':
-                result = self._call_openai(prompt, api_key)
-            elif service == 'anthropic':
-                result = self._call_anthropic(prompt, api_key)
-            elif service == 'google':
-                result = self._call_google(prompt, api_key)
-            else:
-                result = ExtractionResult(False, [], "Service not implemented")
-            
-            # Add processing time
-            result.processing_time = time.time() - start_time
-            
-            return result
-            
-        except Exception as e:
-            return ExtractionResult(
-                False,
-                [],
-                f"Extraction failed: {str(e)}",
-                time.time() - start_time
-            )
+            result = getattr(self, f'_call_{service}')(prompt, api_key)
         finally:
             # Always clear credentials
             self._clear_credentials()
+        
+        self._store_cached(cache_key, result)
+        
+        return result
+    
+    def _cache_key(self, 
+                   qualitative_text: str, 
+                   industry_context: str, 
+                   service: str, 
+                   max_keywords: int) -> bytes:
+        """Hash the extraction inputs into a cache key."""
+        material = '\x1f'.join((qualitative_text, industry_context, service, str(max_keywords)))
+        return hashlib.sha256(material.encode('utf-8')).digest()
+    
+    def _get_cached(self, cache_key: bytes) -> Optional[ExtractionResult]:
+        """Return a copy of a cached result, or None on a miss."""
+        with self._cache_lock:
+            result = self._cache.get(cache_key)
+            if result is None:
+                return None
+            self._cache.move_to_end(cache_key)
+        
+        return replace(
+            result,
+            keywords=list(result.keywords),
+            message=f"{result.message} (cached)",
+            processing_time=0.0
+        )
+    
+    def _store_cached(self, cache_key: bytes, result: ExtractionResult):
+        """Remember a successful result, evicting the least recently used."""
+        if not result.success or self._cache_max <= 0:
+            return
+        
+        with self._cache_lock:
+            self._cache[cache_key] = replace(result, keywords=list(result.keywords))
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self._cache_max:
+                self._cache.popitem(last=False)
     
     def _create_extraction_prompt(self, 
                                  qualitative_text: str, 
                                  industry_context: str, 
-                                 max_keywords: int) -> str:
+                                 max_keywords: int,
+                                 service: Optional[str] = None) -> str:
         """Create optimized prompt for keyword extraction."""
         
         # Truncate text if too long (API limits)
-        max_text_length = 3000
-        if len(qualitative_text) > max_text_length:
-            qualitative_text = qualitative_text[:max_text_length] + "..."
+        qualitative_text = self._truncate_text(qualitative_text, service)
         
-        prompt = f"""You are an expert in perceptual mapping and market research. Analyze the following qualitative research data to extract key product attributes/dimensions that are important to users.
-
+        suffix = _SUFFIX_BY_K.get(max_keywords) or _prompt_suffix(max_keywords)
+        return ''.join((_PROMPT_PREFIX, industry_context, _PROMPT_MID, qualitative_text, suffix))
+    
+    def _truncate_text(self, qualitative_text: str, service: Optional[str] = None) -> str:
+        """Truncate research text to fit within API prompt limits."""
+        if service == 'openai' and TIKTOKEN_AVAILABLE:
+            if len(qualitative_text) <= _MAX_TEXT_TOKENS // 4:
+                return qualitative_text
+            
+            tokens = _TOKEN_ENCODING.encode(qualitative_text)
+            if len(tokens) > _MAX_TEXT_TOKENS:
+                qualitative_text = _TOKEN_ENCODING.decode(tokens[:_MAX_TEXT_TOKENS]) + "..."
+            return qualitative_text
+        
+        # Byte budget for other services; never split a UTF-8 sequence
+        if len(qualitative_text) <= _MAX_TEXT_BYTES // 4:
+            return qualitative_text
+        
+        encoded = qualitative_text.encode('utf-8')
+        if len(encoded) > _MAX_TEXT_BYTES:
+            qualitative_text = encoded[:_MAX_TEXT_BYTES].decode('utf-8', 'ignore') + "..."
+        return qualitative_text
+    
+    def _create_batch_extraction_prompt(self, 
+                                        excerpts: List[Tuple[str, str, str]], 
+                                        max_keywords: int,
+                                        service: Optional[str] = None) -> str:
+        """Create a single prompt covering several labeled (label, text, context) excerpts."""
+        labels = [label for label, _, _ in excerpts]
+        
+        sections = []
+        for label, qualitative_text, industry_context in excerpts:
+            sections.append(f"""[{label}]
 INDUSTRY CONTEXT:
 {industry_context}
 
 QUALITATIVE RESEARCH DATA:
-{qualitative_text}
+{self._truncate_text(qualitative_text, service)}""")
+        
+        excerpt_block = "\n\n".join(sections)
+        
+        prompt = f"""You are an expert in perceptual mapping and market research. You will receive {len(excerpts)} qualitative research excerpts labeled [{labels[0]}]..[{labels[-1]}], each with its own industry context.
+
+{excerpt_block}
 
 TASK:
-Extract exactly {max_keywords} key product attributes that users care about most. These will be used for perceptual mapping analysis.
+For each excerpt, extract exactly {max_keywords} key product attributes that users care about most. These will be used for perceptual mapping analysis.
 
-REQUIREMENTS:
-1. Each attribute should be a measurable product characteristic
-2. Use clear, actionable attribute names (e.g., "Camera_Quality", "Battery_Life")
-3. Focus on attributes mentioned or implied by users
-4. Avoid redundant or overlapping attributes
-5. Prioritize attributes that differentiate products in this market
+{_ATTRIBUTE_REQUIREMENTS}
 
 FORMAT YOUR RESPONSE EXACTLY AS:
+RESULT [{labels[0]}]:
 1. Attribute_Name_1
 2. Attribute_Name_2
-3. Attribute_Name_3
 ...
 {max_keywords}. Attribute_Name_{max_keywords}
+RESULT [{labels[1] if len(labels) > 1 else labels[0]}]:
+1. Attribute_Name_1
+...
 
-Do not include explanations, descriptions, or additional text. Only provide the numbered list of attribute names."""
+Do not include explanations, descriptions, or additional text. Only provide the RESULT headers and numbered lists of attribute names."""
 
         return prompt
     
+    def _parse_batch_response(self, response_text: str) -> Dict[str, List[str]]:
+        """Split a batched response into keyword lists keyed by excerpt label."""
+        headers = list(_BATCH_HEADER_RE.finditer(response_text))
+        
+        results = {}
+        for i, header in enumerate(headers):
+            end = headers[i + 1].start() if i + 1 < len(headers) else len(response_text)
+            keywords = self._parse_keywords_from_response(response_text[header.end():end])
+            if keywords:
+                results[header.group(1).upper()] = keywords
+        
+        return results
+    
+    @timed_extraction("OpenAI call failed")
     def _call_openai(self, prompt: str, api_key: str) -> ExtractionResult:
         """Call OpenAI GPT API."""
-        try:
-            headers = {
-                'Authorization': f'Bearer {api_key}',
-                'Content-Type': 'application/json'
-            }
-            
-            data = {
-                'model': self.SUPPORTED_SERVICES['openai']['model'],
-                'messages': [
-                    {
-                        'role': 'user',
-                        'content': prompt
-                    }
-                ],
-                'max_tokens': 300,
-                'temperature': 0.3
-            }
-            
-            response = requests.post(
-                self.SUPPORTED_SERVICES['openai']['endpoint'],
-                headers=headers,
-                json=data,
-                timeout=30
-            )
-            
-            if response.status_code != 200:
-                return ExtractionResult(
-                    False,
-                    [],
-                    f"OpenAI API error: {response.status_code}"
-                )
-            
-            result = response.json()
-            content = result['choices'][0]['message']['content']
-            
-            keywords = self._parse_keywords_from_response(content)
-            
-            return ExtractionResult(
-                True,
-                keywords,
-                f"Successfully extracted {len(keywords)} keywords via OpenAI"
-            )
-            
-        except Exception as e:
-            return ExtractionResult(False, [], f"OpenAI call failed: {str(e)}")
+        content = self._complete_openai(prompt, api_key)
+        keywords = self._parse_keywords_from_response(content)
+        
+        return ExtractionResult(
+            True,
+            keywords,
+            f"Successfully extracted {len(keywords)} keywords via OpenAI"
+        )
     
+    @timed_extraction("Anthropic call failed")
     def _call_anthropic(self, prompt: str, api_key: str) -> ExtractionResult:
         """Call Anthropic Claude API."""
-        try:
-            headers = {
-                'x-api-key': api_key,
-                'Content-Type': 'application/json',
-                'anthropic-version': '2023-06-01'
-            }
-            
-            data = {
-                'model': self.SUPPORTED_SERVICES['anthropic']['model'],
-                'max_tokens': 300,
-                'messages': [
-                    {
-                        'role': 'user',
-                        'content': prompt
-                    }
-                ]
-            }
-            
-            response = requests.post(
-                self.SUPPORTED_SERVICES['anthropic']['endpoint'],
-                headers=headers,
-                json=data,
-                timeout=30
-            )
-            
-            if response.status_code != 200:
-                return ExtractionResult(
-                    False,
-                    [],
-                    f"Anthropic API error: {response.status_code}"
-                )
-            
-            result = response.json()
-            content = result['content'][0]['text']
-            
-            keywords = self._parse_keywords_from_response(content)
-            
-            return ExtractionResult(
-                True,
-                keywords,
-                f"Successfully extracted {len(keywords)} keywords via Anthropic"
-            )
-            
-        except Exception as e:
-            return ExtractionResult(False, [], f"Anthropic call failed: {str(e)}")
+        content = self._complete_anthropic(prompt, api_key)
+        keywords = self._parse_keywords_from_response(content)
+        
+        return ExtractionResult(
+            True,
+            keywords,
+            f"Successfully extracted {len(keywords)} keywords via Anthropic"
+        )
     
+    @timed_extraction("Google call failed")
     def _call_google(self, prompt: str, api_key: str) -> ExtractionResult:
         """Call Google Gemini API."""
-        try:
-            url = f"{self.SUPPORTED_SERVICES['google']['endpoint']}?key={api_key}"
-            
-            data = {
-                'contents': [
-                    {
-                        'parts': [
-                            {
-                                'text': prompt
-                            }
-                        ]
-                    }
-                ],
-                'generationConfig': {
-                    'maxOutputTokens': 300,
-                    'temperature': 0.3
+        content = self._complete_google(prompt, api_key)
+        keywords = self._parse_keywords_from_response(content)
+        
+        return ExtractionResult(
+            True,
+            keywords,
+            f"Successfully extracted {len(keywords)} keywords via Google"
+        )
+    
+    def _complete_openai(self, prompt: str, api_key: str, max_tokens: int = 300) -> str:
+        """Send prompt to OpenAI GPT and return the raw response text."""
+        headers = {
+            'Authorization': f'Bearer {api_key}',
+            'Content-Type': 'application/json'
+        }
+        
+        data = {
+            'model': self.SUPPORTED_SERVICES['openai']['model'],
+            'messages': [
+                {
+                    'role': 'user',
+                    'content': prompt
                 }
+            ],
+            'max_tokens': max_tokens,
+            'temperature': 0.3
+        }
+        
+        response = _post_json(
+            self.SUPPORTED_SERVICES['openai']['endpoint'],
+            data,
+            headers=headers,
+            timeout=30
+        )
+        
+        if response.status_code != 200:
+            raise ServiceError(f"OpenAI API error: {response.status_code}")
+        
+        result = _response_json(response)
+        return result['choices'][0]['message']['content']
+    
+    def _complete_anthropic(self, prompt: str, api_key: str, max_tokens: int = 300) -> str:
+        """Send prompt to Anthropic Claude and return the raw response text."""
+        headers = {
+            'x-api-key': api_key,
+            'Content-Type': 'application/json',
+            'anthropic-version': '2023-06-01'
+        }
+        
+        data = {
+            'model': self.SUPPORTED_SERVICES['anthropic']['model'],
+            'max_tokens': max_tokens,
+            'messages': [
+                {
+                    'role': 'user',
+                    'content': prompt
+                }
+            ]
+        }
+        
+        response = _post_json(
+            self.SUPPORTED_SERVICES['anthropic']['endpoint'],
+            data,
+            headers=headers,
+            timeout=30
+        )
+        
+        if response.status_code != 200:
+            raise ServiceError(f"Anthropic API error: {response.status_code}")
+        
+        result = _response_json(response)
+        return result['content'][0]['text']
+    
+    def _complete_google(self, prompt: str, api_key: str, max_tokens: int = 300) -> str:
+        """Send prompt to Google Gemini and return the raw response text."""
+        url = f"{self.SUPPORTED_SERVICES['google']['endpoint']}?key={api_key}"
+        
+        data = {
+            'contents': [
+                {
+                    'parts': [
+                        {
+                            'text': prompt
+                        }
+                    ]
+                }
+            ],
+            'generationConfig': {
+                'maxOutputTokens': max_tokens,
+                'temperature': 0.3
             }
-            
-            response = requests.post(url, json=data, timeout=30)
-            
-            if response.status_code != 200:
-                return ExtractionResult(
-                    False,
-                    [],
-                    f"Google API error: {response.status_code}"
-                )
-            
-            result = response.json()
-            content = result['candidates'][0]['content']['parts'][0]['text']
-            
-            keywords = self._parse_keywords_from_response(content)
-            
-            return ExtractionResult(
-                True,
-                keywords,
-                f"Successfully extracted {len(keywords)} keywords via Google"
-            )
-            
-        except Exception as e:
-            return ExtractionResult(False, [], f"Google call failed: {str(e)}")
+        }
+        
+        response = _post_json(url, data, timeout=30)
+        
+        if response.status_code != 200:
+            raise ServiceError(f"Google API error: {response.status_code}")
+        
+        result = _response_json(response)
+        return result['candidates'][0]['content']['parts'][0]['text']
     
     def _parse_keywords_from_response(self, response_text: str) -> List[str]:
         """Parse keywords from AI response."""
@@ -322,18 +539,16 @@ Do not include explanations, descriptions, or additional text. Only provide the
                 continue
             
             # Look for numbered format: "1. Keyword" or "1) Keyword"
-            import re
-            match = re.match(r'^\d+[\.\)]\s*(.+)', line)
+            match = _NUMBERED_ITEM_RE.match(line)
             if match:
                 keyword = match.group(1).strip()
                 # Clean up the keyword
-                keyword = re.sub(r'[^\w\s_]', '', keyword)  # Remove special chars
+                keyword = _KEYWORD_JUNK_RE.sub('', keyword)  # Remove special chars
                 keyword = keyword.replace(' ', '_')  # Replace spaces with underscores
                 keywords.append(keyword)
-            elif line and not any(char.isdigit() for char in line[:3]):
+            elif not _LEADS_WITH_DIGIT.match(line):
                 # Handle cases where numbering might be missing
-                keyword = line.strip()
-                keyword = re.sub(r'[^\w\s_]', '', keyword)
+                keyword = _KEYWORD_JUNK_RE.sub('', line)
                 keyword = keyword.replace(' ', '_')
                 if keyword:
                     keywords.append(keyword)
@@ -348,11 +563,33 @@ Do not include explanations, descriptions, or additional text. Only provide the
         
         return unique_keywords[:12]  # Limit to max 12 keywords
     
+    @property
+    def _active_credentials(self) -> Optional[bytearray]:
+        """Credential buffer of the call running on this thread, if any."""
+        return getattr(self._credentials_local, 'buffer', None)
+    
+    @_active_credentials.setter
+    def _active_credentials(self, buffer: Optional[bytearray]):
+        self._credentials_local.buffer = buffer
+    
+    def _complete_with_credentials(self, 
+                                   service: str, 
+                                   prompt: str, 
+                                   credentials: bytearray, 
+                                   max_tokens: int = 300) -> str:
+        """Run a raw completion with the key held in the zeroable credential buffer."""
+        try:
+            self._active_credentials = bytearray(credentials)
+            complete = getattr(self, f'_complete_{service}')
+            return complete(prompt, self._active_credentials.decode('utf-8'), max_tokens=max_tokens)
+        finally:
+            self._clear_credentials()
+    
     def _clear_credentials(self):
         """Clear credentials from memory."""
-        if self._active_credentials:
-            # Overwrite the credential string
-            self._active_credentials = 'X' * len(self._active_credentials)
+        if self._active_credentials is not None:
+            # Zero the buffer in place rather than allocating a replacement
+            _zero_buffer(self._active_credentials)
             self._active_credentials = None
     
     def get_supported_services(self) -> Dict[str, str]:
@@ -362,6 +599,172 @@ Do not include explanations, descriptions, or additional text. Only provide the
             for service_id, config in self.SUPPORTED_SERVICES.items()
         }
 
+class BatchedExtractor:
+    """
+    Coalesces concurrent keyword extraction requests into single GenAI calls.
+    
+    Requests submitted within a short window are grouped by service, API key
+    digest and keyword count, and each group is answered with one consolidated
+    prompt. Requests never share a call with a different API key.
+    """
+    
+    BATCH_LABELS = 'ABCDEFGH'
+    
+    def __init__(self, 
+                 extractor: Optional[GenAIExtractor] = None, 
+                 max_batch: int = 8, 
+                 max_delay_ms: int = 25,
+                 max_workers: int = 4):
+        """Initialize the batcher around an existing extractor."""
+        self.extractor = extractor or GenAIExtractor()
+        self.max_batch = max(1, min(max_batch, len(self.BATCH_LABELS)))
+        self.max_delay = max_delay_ms / 1000.0
+        
+        self._queue = queue.Queue()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        self._worker = None
+        self._worker_lock = threading.Lock()
+    
+    def submit(self, 
+               qualitative_text: str, 
+               industry_context: str, 
+               service: str, 
+               api_key: str,
+               max_keywords: int = 12) -> Future:
+        """Queue an extraction request; the returned future resolves to an ExtractionResult."""
+        future = Future()
+        
+        if service in self.extractor.SUPPORTED_SERVICES:
+            cache_key = self.extractor._cache_key(qualitative_text, industry_context, service, max_keywords)
+            cached = self.extractor._get_cached(cache_key)
+            if cached is not None:
+                future.set_result(cached)
+                return future
+        
+        # Queue the key in a zeroable buffer and group on its digest, never the key itself
+        credentials = bytearray(api_key, 'utf-8')
+        key_digest = hashlib.sha256(credentials).digest()
+        
+        self._ensure_worker()
+        self._queue.put((qualitative_text, industry_context, service, credentials, key_digest, max_keywords, future))
+        return future
+    
+    def _ensure_worker(self):
+        """Start the collector thread on first use."""
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._collect_batches, daemon=True)
+                self._worker.start()
+    
+    def _collect_batches(self):
+        """Gather queued requests for up to max_delay, then dispatch them by group."""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_delay
+            
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            groups = {}
+            for request in batch:
+                _, _, service, _, key_digest, max_keywords, _ = request
+                groups.setdefault((service, key_digest, max_keywords), []).append(request)
+            
+            for group in groups.values():
+                self._pool.submit(self._run_batch, group)
+    
+    def _run_batch(self, batch: List[tuple]):
+        """Resolve every future in a same-credential batch."""
+        start_time = time.perf_counter()
+        handed_off = []
+        
+        try:
+            if len(batch) == 1:
+                self._run_single(batch[0])
+                return
+            
+            _, _, service, credentials, _, max_keywords, _ = batch[0]
+            
+            if service not in self.extractor.SUPPORTED_SERVICES:
+                for request in batch:
+                    self._resolve(request, ExtractionResult(False, [], f"Unsupported service: {service}"))
+                return
+            
+            excerpts = [
+                (label, request[0], request[1])
+                for label, request in zip(self.BATCH_LABELS, batch)
+            ]
+            prompt = self.extractor._create_batch_extraction_prompt(excerpts, max_keywords, service)
+            
+            try:
+                content = self.extractor._complete_with_credentials(
+                    service, prompt, credentials, max_tokens=300 * len(batch)
+                )
+            except Exception:
+                # Fall back to concurrent individual calls so one bad batch doesn't fail everyone
+                for request in batch:
+                    handed_off.append(request)
+                    self._pool.submit(self._run_single, request)
+                return
+            
+            results = self.extractor._parse_batch_response(content)
+            service_name = self.extractor.SUPPORTED_SERVICES[service]['name']
+            
+            for label, request in zip(self.BATCH_LABELS, batch):
+                keywords = results.get(label)
+                if keywords:
+                    result = ExtractionResult(
+                        True,
+                        keywords,
+                        f"Successfully extracted {len(keywords)} keywords via {service_name} (batched)",
+                        time.perf_counter() - start_time
+                    )
+                    text, context = request[0], request[1]
+                    self.extractor._store_cached(
+                        self.extractor._cache_key(text, context, service, max_keywords), result
+                    )
+                    self._resolve(request, result)
+                else:
+                    # Partial failure: retry just this excerpt on its own, alongside the others
+                    handed_off.append(request)
+                    self._pool.submit(self._run_single, request)
+                    
+        except Exception as e:
+            for request in batch:
+                if not request[-1].done() and request not in handed_off:
+                    self._resolve(request, ExtractionResult(
+                        False, [], f"Extraction failed: {str(e)}", time.perf_counter() - start_time
+                    ))
+    
+    def _resolve(self, request: tuple, result: ExtractionResult):
+        """Resolve a request's future and wipe its queued key."""
+        _zero_buffer(request[3])
+        request[-1].set_result(result)
+    
+    def _run_single(self, request: tuple):
+        """Run one request through the regular extraction path."""
+        text, context, service, credentials, _, max_keywords, future = request
+        try:
+            result = self.extractor.extract_keywords(
+                qualitative_text=text,
+                industry_context=context,
+                service=service,
+                api_key=credentials.decode('utf-8'),
+                max_keywords=max_keywords
+            )
+        except Exception as e:
+            result = ExtractionResult(False, [], f"Extraction failed: {str(e)}")
+        finally:
+            # Wipe the queued key once its own call is done
+            _zero_buffer(credentials)
+        future.set_result(result)
+
 def test_extraction():
     """Test function for keyword extraction."""
     print("🧪 Testing GenAI Extraction")
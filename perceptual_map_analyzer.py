@@ -8,9 +8,10 @@ correlation analysis, and strategic insights generation.
 
 Usage:
     python perceptual_map_analyzer.py
+    PERCEPTUAL_MAP_HEADLESS=1 python perceptual_map_analyzer.py  # no GUI windows
 
 Requirements:
-    pip install pandas numpy matplotlib seaborn scipy
+    pip install pandas numpy matplotlib scipy
 
 Features:
     - Create perceptual maps for any dimension combination
@@ -20,16 +21,37 @@ Features:
     - Export capabilities for all 28 dimension combinations
 """
 
+import os
+import matplotlib
+
+# Opt-in headless mode for batch jobs, servers and CI; without a display
+# matplotlib already falls back to Agg on its own
+_HEADLESS = os.environ.get('PERCEPTUAL_MAP_HEADLESS', '').strip().lower() not in ('', '0', 'false', 'no')
+if _HEADLESS:
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
+import matplotlib.colors as mcolors
+from matplotlib.collections import LineCollection
 import pandas as pd
 import numpy as np
-import seaborn as sns
-from matplotlib.patches import Ellipse
 import itertools
-from scipy import stats
+import functools
+from concurrent.futures import ProcessPoolExecutor
 import warnings
 warnings.filterwarnings('ignore')
 
+def _lighten(hex_color, factor):
+    """Lighten a hex color by mixing it with white."""
+    rgb = mcolors.hex2color(hex_color)
+    return mcolors.rgb2hex([min(1, c + (1 - c) * factor) for c in rgb])
+
+def _png_save_kwargs(path):
+    """Fast deflate for PNG output; zlib's default level dominates save time."""
+    if str(path).lower().endswith('.png'):
+        return {'pil_kwargs': {'compress_level': 1}}
+    return {}
+
 class PerceptualMapAnalyzer:
     """
     Advanced perceptual mapping tool that can create maps for any combination 
@@ -54,6 +76,9 @@ class PerceptualMapAnalyzer:
         self.dimensions = [col for col in self.data.columns 
                           if col not in ['phone_model', 'brand', 'tier', 'popularity']]
         
+        # Column arrays for the plotting and analysis paths, extracted once
+        self._arr = {col: self.data[col].to_numpy() for col in self.data.columns}
+        
         # Define color schemes for brands
         self.brand_colors = {
             'Apple': '#007AFF',
@@ -63,6 +88,18 @@ class PerceptualMapAnalyzer:
             'Xiaomi': '#d62728'
         }
         
+        # Bubble color per phone and a much lighter shade for its label background,
+        # lightened once per brand rather than once per phone
+        self._bg_color_by_brand = {brand: _lighten(color, 0.7) for brand, color in self.brand_colors.items()}
+        self._colors = self.data['brand'].map(self.brand_colors).fillna('#666666').to_numpy()
+        self._bg_colors = self.data['brand'].map(self._bg_color_by_brand).fillna(_lighten('#666666', 0.7)).to_numpy()
+        
+        # Compact label text per phone
+        self._short_labels = (self.data['phone_model']
+                              .str.replace('Samsung Galaxy ', 'Galaxy ', regex=False)
+                              .str.replace('Google Pixel ', 'Pixel ', regex=False)
+                              .to_numpy())
+        
         # Define markers for tiers
         self.tier_markers = {
             'Premium': 'o',
@@ -74,6 +111,12 @@ class PerceptualMapAnalyzer:
         self.min_bubble_size = 50
         self.max_bubble_size = 1200
         
+        # Bubble size per phone, in row order; phones default to mid popularity
+        if 'popularity' in self.data.columns:
+            self._sizes_cache = self._bubble_sizes(self._arr['popularity'])
+        else:
+            self._sizes_cache = self._bubble_sizes(np.full(len(self.data), 50.0))
+        
         print(f"🎯 Perceptual Map Analyzer initialized")
         print(f"📱 Analyzing {len(self.data)} phone models")
         print(f"📊 {len(self.dimensions)} dimensions available")
@@ -96,123 +139,125 @@ class PerceptualMapAnalyzer:
             'OnePlus Nord 3': 28
         }
         
-        df['popularity'] = df['phone_model'].map(popularity_data)
+        # One vectorized hashtable lookup; unknown models get NaN
+        df['popularity'] = pd.Series(popularity_data).reindex(df['phone_model'].to_numpy()).to_numpy()
         return df
     
-    def _calculate_bubble_size(self, popularity_score):
-        """Calculate bubble size based on popularity score."""
-        if pd.isna(popularity_score):
-            return self.min_bubble_size
-            
+    def _bubble_sizes(self, popularity):
+        """Calculate bubble sizes for an array of popularity scores."""
+        popularity = np.asarray(popularity, dtype=np.float64)
+        
+        # Missing popularity gets the smallest bubble
+        popularity = np.where(np.isnan(popularity), 1.0, popularity)
+        
         # Scale popularity to bubble size range
-        normalized_pop = (popularity_score - 1) / 99  # Normalize to 0-1
-        size = self.min_bubble_size + (normalized_pop * (self.max_bubble_size - self.min_bubble_size))
-        return size
+        normalized_pop = (popularity - 1) / 99  # Normalize to 0-1
+        return self.min_bubble_size + (normalized_pop * (self.max_bubble_size - self.min_bubble_size))
     
     def _add_smart_labels_with_leaders(self, ax, x_dimension, y_dimension):
         """Add labels with short leader lines at 2-3 diameter distance from circle center."""
-        import numpy as np
-        
-        for _, row in self.data.iterrows():
-            label = row['phone_model'].replace('Samsung Galaxy ', 'Galaxy ')
-            label = label.replace('Google Pixel ', 'Pixel ')
-            
-            # Calculate bubble radius in data coordinates
-            bubble_size = self._calculate_bubble_size(row.get('popularity', 50))
-            # Convert matplotlib size to radius (size is area, so sqrt to get radius)
-            radius_points = np.sqrt(bubble_size) / 2
-            
-            # Convert radius from points to data coordinates (approximate)
-            x_range = ax.get_xlim()[1] - ax.get_xlim()[0]
-            y_range = ax.get_ylim()[1] - ax.get_ylim()[0]
-            fig_width_inches = ax.figure.get_figwidth()
-            fig_height_inches = ax.figure.get_figheight()
-            
-            # Rough conversion from points to data units
-            radius_data_x = (radius_points / 72) * (x_range / fig_width_inches)
-            radius_data_y = (radius_points / 72) * (y_range / fig_height_inches)
-            
-            # Position label at 2.5 diameters to the left of circle center
-            label_offset_x = -2.5 * 2 * radius_data_x  # 2.5 diameters
-            label_offset_y = 0  # Keep at same height as circle center
-            
-            label_x = row[x_dimension] + label_offset_x
-            label_y = row[y_dimension] + label_offset_y
+        x_values = self._arr[x_dimension]
+        y_values = self._arr[y_dimension]
+        
+        # Rough conversion from points to data units; the same for every label
+        x_min, x_max = ax.get_xlim()
+        x_scale = (x_max - x_min) / ax.figure.get_figwidth() / 72
+        
+        # Convert matplotlib size to radius (size is area, so sqrt to get radius)
+        radius_data_x = np.sqrt(self._sizes_cache) / 2 * x_scale
+        
+        # Position labels at 2.5 diameters to the left of circle centers, same height
+        label_x = x_values - 2.5 * 2 * radius_data_x
+        label_y = y_values
+        
+        # All leader lines as one collection, from each label to its circle center
+        segments = np.stack([np.column_stack([label_x, label_y]),
+                             np.column_stack([x_values, y_values])], axis=1)
+        ax.add_collection(LineCollection(segments, colors=self._colors, alpha=0.7, linewidths=1),
+                          autolim=False)
+        
+        # Phones sharing a brand color share one box style
+        positions_by_color = {}
+        for position, color in enumerate(self._colors):
+            positions_by_color.setdefault(color, []).append(position)
+        
+        for bubble_color, positions in positions_by_color.items():
+            bbox = dict(boxstyle='round,pad=0.3', 
+                        facecolor=self._bg_colors[positions[0]], alpha=0.9, 
+                        edgecolor=bubble_color, linewidth=1)
             
-            # Get brand color and make it lighter for background
-            brand = row['brand']
-            bubble_color = self.brand_colors.get(brand, '#666666')
-            
-            # Convert hex to lighter shade for background
-            def lighten_color(hex_color, factor=0.3):
-                """Convert hex color to lighter shade"""
-                import matplotlib.colors as mcolors
-                rgb = mcolors.hex2color(hex_color)
-                # Lighten by mixing with white
-                light_rgb = [min(1, c + (1-c) * factor) for c in rgb]
-                return mcolors.rgb2hex(light_rgb)
-            
-            bg_color = lighten_color(bubble_color, 0.7)  # Very light version
-            
-            # Add the label
-            ax.annotate(label, 
-                       xy=(row[x_dimension], row[y_dimension]),  # Point to circle center
-                       xytext=(label_x, label_y),  # Label position
-                       xycoords='data',
-                       textcoords='data',
-                       fontsize=9, fontweight='bold',
-                       bbox=dict(boxstyle='round,pad=0.3', 
-                               facecolor=bg_color, alpha=0.9, 
-                               edgecolor=bubble_color, linewidth=1),
-                       arrowprops=dict(arrowstyle='-', 
-                                     color=bubble_color, alpha=0.7, linewidth=1),
-                       ha='right', va='center')
+            for position in positions:
+                ax.text(label_x[position], label_y[position], self._short_labels[position],
+                        fontsize=9, fontweight='bold', bbox=bbox,
+                        ha='right', va='center')
     
     def create_perceptual_map(self, x_dimension, y_dimension, 
                             title=None, save_path=None, 
                             show_quadrant_labels=True,
                             show_brand_ellipses=False,
                             show_popularity_legend=True,
-                            figsize=(11.2, 8)):
+                            figsize=(11.2, 8),
+                            dpi=300,
+                            show=True):
         """
         Create a perceptual map for any two dimensions with bubble sizes based on popularity
         """
         
         fig, ax = plt.subplots(figsize=figsize)
         
-        # Get data for the two dimensions
-        x_data = self.data[x_dimension]
-        y_data = self.data[y_dimension]
+        self.create_perceptual_map_on_ax(ax, x_dimension, y_dimension,
+                                         title=title,
+                                         show_quadrant_labels=show_quadrant_labels,
+                                         show_brand_ellipses=show_brand_ellipses,
+                                         show_popularity_legend=show_popularity_legend)
+        
+        plt.tight_layout()
+        
+        # Save if path provided
+        if save_path:
+            plt.savefig(save_path, dpi=dpi, bbox_inches='tight', facecolor='white',
+                        **_png_save_kwargs(save_path))
+            print(f"📁 Map saved to: {save_path}")
+        
+        if show:
+            plt.show()
+        return fig, ax
+    
+    def create_perceptual_map_on_ax(self, ax, x_dimension, y_dimension,
+                                    title=None,
+                                    show_quadrant_labels=True,
+                                    show_brand_ellipses=False,
+                                    show_popularity_legend=True):
+        """
+        Draw a perceptual map onto an existing, empty axes.
+        
+        Does everything create_perceptual_map does except creating,
+        saving and showing the figure, so callers can reuse one figure.
+        """
+        
+        # Summary statistics for the two dimensions
+        x_min, x_max, x_mean = self._col_stats.loc[x_dimension]
+        y_min, y_max, y_mean = self._col_stats.loc[y_dimension]
         
         # Create scatter plot with popularity-based bubble sizes
-        for _, row in self.data.iterrows():
-            brand = row['brand']
-            tier = row['tier']
-            popularity = row.get('popularity', 50)
-            
-            color = self.brand_colors.get(brand, '#666666')
-            marker = 'o'  # Use circles for all phones regardless of tier
-            bubble_size = self._calculate_bubble_size(popularity)
-            
-            # Create scatter plot
-            ax.scatter(row[x_dimension], row[y_dimension], 
-                      c=color, marker=marker, s=bubble_size, 
-                      alpha=0.7, edgecolors='black', linewidth=1.5)
+        # One collection for all phones; circles regardless of tier
+        ax.scatter(self._arr[x_dimension], self._arr[y_dimension], 
+                  c=self._colors, marker='o', s=self._sizes_cache, 
+                  alpha=0.7, edgecolors='black', linewidth=1.5,
+                  rasterized=True)  # Keep vector exports light; axes and text stay vector
         
         # Add smart labels with leader lines
         self._add_smart_labels_with_leaders(ax, x_dimension, y_dimension)
         
         # Add reference lines at means
-        ax.axhline(y_data.mean(), color='gray', linestyle='--', alpha=0.5, linewidth=1)
-        ax.axvline(x_data.mean(), color='gray', linestyle='--', alpha=0.5, linewidth=1)
+        ax.axhline(y_mean, color='gray', linestyle='--', alpha=0.5, linewidth=1)
+        ax.axvline(x_mean, color='gray', linestyle='--', alpha=0.5, linewidth=1)
         
         # Customize axes
         ax.set_xlabel(x_dimension.replace('_', ' ').title(), fontsize=14, fontweight='bold')
         ax.set_ylabel(y_dimension.replace('_', ' ').title(), fontsize=14, fontweight='bold')
         
         # Set axis limits with padding
-        x_min, x_max = x_data.min(), x_data.max()
-        y_min, y_max = y_data.min(), y_data.max()
         x_padding = (x_max - x_min) * 0.15
         y_padding = (y_max - y_min) * 0.15
         
@@ -246,24 +291,15 @@ class PerceptualMapAnalyzer:
         
         # Add grid
         ax.grid(True, alpha=0.3, linestyle=':')
-        
-        plt.tight_layout()
-        
-        # Save if path provided
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight', facecolor='white')
-            print(f"📁 Map saved to: {save_path}")
-        
-        plt.show()
-        return fig, ax
     
     def _create_enhanced_legend(self, ax, show_popularity_legend):
         """Create comprehensive legend including brands, tiers, and popularity sizes."""
         
         # Brand legend
         brand_handles = []
+        present_brands = set(self._arr['brand'])
         for brand, color in self.brand_colors.items():
-            if brand in self.data['brand'].values:
+            if brand in present_brands:
                 handle = plt.Line2D([0], [0], marker='o', color='w', 
                                   markerfacecolor=color, markersize=12,
                                   markeredgecolor='black', markeredgewidth=1.5, 
@@ -277,13 +313,26 @@ class PerceptualMapAnalyzer:
                                    fontsize=10, title_fontsize=12)
             brand_legend.get_title().set_fontweight('bold')
             ax.add_artist(brand_legend)
+            brand_legend.set_clip_on(False)  # Sits outside the axes; add_artist clips to them
     
     def analyze_popularity_performance_relationship(self, dimension):
         """Analyze relationship between popularity and performance on a dimension."""
         if 'popularity' not in self.data.columns:
             return "Popularity data not available"
         
-        correlation, p_value = stats.pearsonr(self.data['popularity'], self.data[dimension])
+        # Only this analysis needs scipy; keep it off the import path
+        from scipy import stats
+        
+        popularity = self._arr['popularity'].astype(np.float64)
+        performance = self._arr[dimension].astype(np.float64)
+        # Clip float round-off so a perfect correlation gives an infinite t, not NaN
+        correlation = np.clip(np.float64(self._correlations.loc['popularity', dimension]), -1.0, 1.0)
+        
+        # Two-sided p-value from the t statistic of r over the pairwise-complete rows
+        n = int((~(np.isnan(popularity) | np.isnan(performance))).sum())
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_stat = correlation * np.sqrt((n - 2) / (1 - correlation * correlation))
+        p_value = 2 * stats.t.sf(abs(t_stat), n - 2)
         
         analysis = {
             'dimension': dimension,
@@ -306,18 +355,43 @@ class PerceptualMapAnalyzer:
             analysis['insights'].append(f"No significant correlation between popularity and {dimension.replace('_', ' ')}")
         
         # Find outliers
-        performance_mean = self.data[dimension].mean()
-        popularity_mean = self.data['popularity'].mean()
+        performance_mean = np.nanmean(performance)
+        popularity_mean = np.nanmean(popularity)
         
-        high_perf_low_pop = self.data[(self.data[dimension] > performance_mean) & 
-                                     (self.data['popularity'] < popularity_mean)]
+        high_perf_low_pop = (performance > performance_mean) & (popularity < popularity_mean)
         
-        if len(high_perf_low_pop) > 0:
-            models = high_perf_low_pop['phone_model'].tolist()
+        if high_perf_low_pop.any():
+            models = self._arr['phone_model'][high_perf_low_pop].tolist()
             analysis['insights'].append(f"Hidden gems (high {dimension.replace('_', ' ')}, low popularity): {', '.join(models)}")
         
         return analysis
     
+    @functools.cached_property
+    def _col_stats(self):
+        """Min, max and mean of every numeric dimension, one row per dimension."""
+        numeric = self.data[self.dimensions].select_dtypes('number')
+        return numeric.agg(['min', 'max', 'mean']).T
+    
+    @functools.cached_property
+    def _dim_cols(self):
+        """Dimension columns plus popularity when available."""
+        return self.dimensions + (['popularity'] if 'popularity' in self.data.columns else [])
+    
+    @functools.cached_property
+    def _X(self):
+        """Contiguous float32 matrix of the dimension columns, one row per phone."""
+        return np.ascontiguousarray(self.data[self._dim_cols].to_numpy(np.float32))
+    
+    @functools.cached_property
+    def _correlations(self):
+        """Pairwise correlations of all dimensions and popularity, computed once."""
+        if np.isnan(self._X).any():
+            # Missing ratings need pandas' pairwise-complete handling
+            return self.data[self._dim_cols].corr()
+        
+        return pd.DataFrame(np.corrcoef(self._X, rowvar=False),
+                            index=self._dim_cols, columns=self._dim_cols)
+    
     def _interpret_correlation(self, correlation):
         """Interpret correlation coefficient strength."""
         abs_corr = abs(correlation)
@@ -332,7 +406,7 @@ class PerceptualMapAnalyzer:
         else:
             return "Very Weak"
     
-    def create_correlation_matrix(self, include_popularity=True, figsize=(12, 10)):
+    def create_correlation_matrix(self, include_popularity=True, figsize=(12, 10), show=True):
         """Create correlation matrix heatmap of all dimensions."""
         
         # Select columns for correlation
@@ -340,30 +414,55 @@ class PerceptualMapAnalyzer:
         if include_popularity and 'popularity' in self.data.columns:
             corr_columns.append('popularity')
         
-        # Calculate correlation matrix
-        corr_matrix = self.data[corr_columns].corr()
+        # Slice the cached correlation matrix
+        corr_matrix = self._correlations.loc[corr_columns, corr_columns].copy()
         
         # Create heatmap
         fig, ax = plt.subplots(figsize=figsize)
         
-        mask = np.triu(np.ones_like(corr_matrix, dtype=bool))
+        # Show the lower triangle only; masked cells are left blank
+        values = corr_matrix.to_numpy()
+        mask = np.triu(np.ones_like(values, dtype=bool))
+        
+        image = ax.imshow(np.where(mask, np.nan, values), cmap='RdYlBu_r', vmin=-1, vmax=1)
+        fig.colorbar(image, ax=ax, shrink=0.8)
+        
+        # Annotate visible cells, dark text on light cells and vice versa
+        rows, cols = np.nonzero(~mask)
+        cell_colors = image.cmap(image.norm(values[rows, cols]))
+        luminance = cell_colors[:, :3] @ np.array([0.2126, 0.7152, 0.0722])
+        for i, j, value, lum in zip(rows, cols, values[rows, cols], luminance):
+            ax.text(j, i, f'{value:.3f}', ha='center', va='center', fontsize=8,
+                    color='white' if lum < 0.408 else 'black')
         
-        sns.heatmap(corr_matrix, mask=mask, annot=True, cmap='RdYlBu_r',
-                   center=0, square=True, linewidths=0.5, 
-                   cbar_kws={"shrink": .8}, fmt='.3f', ax=ax)
+        ax.set_xticks(range(len(corr_columns)))
+        ax.set_xticklabels(corr_columns, rotation=45, ha='right')
+        ax.set_yticks(range(len(corr_columns)))
+        ax.set_yticklabels(corr_columns)
+        for spine in ax.spines.values():
+            spine.set_visible(False)
         
         ax.set_title('Dimension Correlation Matrix\n(Including Popularity)', 
                     fontsize=16, fontweight='bold', pad=20)
         
         plt.tight_layout()
-        plt.show()
+        if show:
+            plt.show()
         
         return corr_matrix
     
-    def generate_all_dimension_maps(self, output_dir='perceptual_maps', file_format='png'):
-        """Generate perceptual maps for all possible dimension combinations."""
-        import os
+    def generate_all_dimension_maps(self, output_dir='perceptual_maps', file_format='png',
+                                    max_workers=None, dpi=300):
+        """
+        Generate perceptual maps for all possible dimension combinations.
         
+        Args:
+            output_dir: Directory the map files are written to
+            file_format: Image format and file extension for each map
+            max_workers: Worker processes to render with (default: one per CPU,
+                capped at the number of maps); 1 renders in this process
+            dpi: Resolution of each map; lower values render quicker drafts
+        """
         # Create output directory
         os.makedirs(output_dir, exist_ok=True)
         
@@ -371,22 +470,54 @@ class PerceptualMapAnalyzer:
         
         print(f"📊 Generating {len(dimension_pairs)} perceptual maps...")
         
-        for i, (dim_x, dim_y) in enumerate(dimension_pairs, 1):
-            print(f"  Creating map {i}/{len(dimension_pairs)}: {dim_x} vs {dim_y}")
-            
-            # Create filename
-            filename = f"{dim_x}_vs_{dim_y}.{file_format}"
-            filepath = os.path.join(output_dir, filename)
-            
-            # Create map
-            fig, ax = self.create_perceptual_map(dim_x, dim_y, 
-                                              save_path=filepath,
-                                              show_quadrant_labels=True)
-            
-            plt.close(fig)  # Close figure to save memory
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = max(1, min(max_workers, len(dimension_pairs)))
+        
+        jobs = [
+            (i, len(dimension_pairs), dim_x, dim_y, os.path.join(output_dir, f"{dim_x}_vs_{dim_y}.{file_format}"))
+            for i, (dim_x, dim_y) in enumerate(dimension_pairs, 1)
+        ]
+        
+        if max_workers == 1:
+            self._render_maps(jobs, dpi)
+        else:
+            # Maps are independent; each worker renders its share on its own Agg figure
+            chunks = [jobs[k::max_workers] for k in range(max_workers)]
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_map_worker) as executor:
+                for future in [executor.submit(self._render_maps, chunk, dpi) for chunk in chunks]:
+                    future.result()
         
         print(f"✅ All {len(dimension_pairs)} maps generated in '{output_dir}' directory")
         return dimension_pairs
+    
+    def _render_maps(self, jobs, dpi):
+        """Render (index, total, x, y, path) map jobs, reusing a single figure."""
+        
+        # One figure for the whole batch; each map redraws onto the cleared axes
+        fig, ax = plt.subplots(figsize=(11.2, 8))
+        
+        # tight_layout starts from the current margins, so restore the originals
+        # for every map to keep each one independent of the maps before it
+        margins = {name: getattr(fig.subplotpars, name) for name in ('left', 'right', 'bottom', 'top')}
+        
+        try:
+            for i, total, dim_x, dim_y, filepath in jobs:
+                print(f"  Creating map {i}/{total}: {dim_x} vs {dim_y}")
+                
+                # Create map
+                ax.clear()
+                fig.subplots_adjust(**margins)
+                self.create_perceptual_map_on_ax(ax, dim_x, dim_y, show_quadrant_labels=True)
+                fig.tight_layout()
+                fig.savefig(filepath, dpi=dpi, bbox_inches='tight', facecolor='white',
+                            **_png_save_kwargs(filepath))
+        finally:
+            plt.close(fig)  # Close figure to save memory
+
+def _init_map_worker():
+    """Give each map worker process the non-interactive Agg backend."""
+    plt.switch_backend('Agg')
 
 def create_sample_dataset():
     """Create sample dataset for demonstration if CSV files not available."""
@@ -16,18 +16,52 @@ Output:
 """
 
 import pandas as pd
-import random
+import numpy as np
 import csv
-from datetime import datetime, timedelta
-from collections import Counter
+from collections import Counter, defaultdict
 import re
+import itertools
+
+# Meaningful words for keyword analysis: letters only, longer than 3 characters
+_WORD_RE = re.compile(r'\b[a-zA-Z]{4,}\b')
 
 class QualitativeDatasetGenerator:
     """Generates realistic smartphone user interview datasets."""
     
+    # Upper bound on attributes mentioned per interview
+    _MAX_ATTRIBUTES = 6
+    
+    # Phrasings wrapped around a lowercased attribute; index 0 keeps it verbatim
+    _VARIATION_PREFIXES = ('', 'For me, ', 'I really value ', 'What matters to me is ', 'I prioritize ')
+    
+    # Positioning dimensions with the interview keywords that signal them
+    _DIMENSION_KEYWORDS = {
+        'Camera_Quality': (['camera', 'photo', 'photography', 'pictures', 'video', 'social'],
+                           'Photography and video capabilities'),
+        'Battery_Life': (['battery', 'charging', 'power', 'lasting', 'duration'],
+                         'Battery performance and longevity'),
+        'Performance': (['performance', 'fast', 'speed', 'smooth', 'processing', 'gaming'],
+                        'Processing speed and responsiveness'),
+        'Price_Value': (['price', 'value', 'money', 'affordable', 'cost', 'budget', 'cheap'],
+                        'Price and value perception'),
+        'Build_Quality': (['quality', 'build', 'durable', 'premium', 'materials', 'construction'],
+                          'Construction quality and durability'),
+        'Display_Quality': (['display', 'screen', 'colors', 'clear', 'resolution', 'viewing'],
+                            'Screen quality and visual experience'),
+        'Design_Appeal': (['design', 'appearance', 'style', 'aesthetic', 'look', 'attractive'],
+                          'Visual design and aesthetics'),
+        'Feature_Richness': (['features', 'functionality', 'capabilities', 'functions'],
+                             'Breadth of features and functionality')
+    }
+    _KEYWORD_TO_DIMENSION = {
+        keyword: dimension
+        for dimension, (keywords, _) in _DIMENSION_KEYWORDS.items()
+        for keyword in keywords
+    }
+    
     def __init__(self):
-        # Set seed for reproducible results
-        random.seed(42)
+        # Single seeded generator for reproducible results
+        self.rng = np.random.default_rng(42)
         
         # Demographics data
         self.countries = ['USA', 'UK', 'Canada', 'Australia', 'New Zealand', 'South Africa']
@@ -164,35 +198,33 @@ class QualitativeDatasetGenerator:
             "Good resale value",
             "Regular software updates"
         ]
+        self._attr_pool_np = np.array(self.attribute_pool, dtype=object)
         
     def generate_user_profile(self):
         """Generate a random user demographic profile."""
         return {
-            'user_id': f"USER_{random.randint(1000, 9999)}",
-            'country': random.choice(self.countries),
-            'age_group': random.choice(self.age_groups),
-            'occupation': random.choice(self.occupations),
+            'user_id': f"USER_{self.rng.integers(1000, 10000)}",
+            'country': self.rng.choice(self.countries),
+            'age_group': self.rng.choice(self.age_groups),
+            'occupation': self.rng.choice(self.occupations),
         }
     
     def generate_user_attributes(self, num_attributes=None):
         """Generate realistic user attributes with natural variation."""
         if num_attributes is None:
-            num_attributes = random.randint(3, 6)
+            num_attributes = int(self.rng.integers(3, self._MAX_ATTRIBUTES + 1))
         
-        # Select attributes without replacement
-        user_attributes = random.sample(self.attribute_pool, num_attributes)
+        # Select attributes without replacement, drawing all variation picks at once
+        indices = self.rng.choice(len(self._attr_pool_np), size=num_attributes, replace=False)
+        variations = self.rng.integers(0, len(self._VARIATION_PREFIXES), size=num_attributes)
         
         # Add some natural language variation
         varied_attributes = []
-        for attr in user_attributes:
-            variations = [
-                attr,
-                f"For me, {attr.lower()}",
-                f"I really value {attr.lower()}",
-                f"What matters to me is {attr.lower()}",
-                f"I prioritize {attr.lower()}"
-            ]
-            varied_attributes.append(random.choice(variations))
+        for attr, variation in zip(self._attr_pool_np[indices], variations):
+            if variation == 0:
+                varied_attributes.append(attr)
+            else:
+                varied_attributes.append(self._VARIATION_PREFIXES[variation] + attr.lower())
         
         return varied_attributes
     
@@ -201,50 +233,47 @@ class QualitativeDatasetGenerator:
         print("🎯 Generating Qualitative Dataset...")
         print(f"Creating {num_users} user interviews...")
         
-        dataset = []
-        interview_dates = []
-        
         # Generate interview dates over 3 months
-        start_date = datetime(2025, 1, 15)
-        for i in range(num_users):
-            interview_date = start_date + timedelta(days=random.randint(0, 90))
-            interview_dates.append(interview_date.strftime("%Y-%m-%d"))
+        offsets = self.rng.integers(0, 91, size=num_users).astype('timedelta64[D]')
+        interview_dates = np.datetime_as_string(np.datetime64('2025-01-15') + offsets, unit='D')
+        
+        # Preallocate columns for the most rows possible, one row per attribute
+        capacity = num_users * self._MAX_ATTRIBUTES
+        columns = {
+            'user_id': np.empty(capacity, dtype=object),
+            'country': np.empty(capacity, dtype=object),
+            'age_group': np.empty(capacity, dtype=object),
+            'occupation': np.empty(capacity, dtype=object),
+            'interview_date': np.empty(capacity, dtype=object),
+            'attribute_number': np.empty(capacity, dtype=np.int64),
+            'attribute_text': np.empty(capacity, dtype=object),
+            'total_attributes_mentioned': np.empty(capacity, dtype=np.int64)
+        }
         
+        idx = 0
         for i in range(num_users):
             user_profile = self.generate_user_profile()
             user_attributes = self.generate_user_attributes()
+            rows = slice(idx, idx + len(user_attributes))
             
-            # Create separate row for each attribute
-            for j, attribute in enumerate(user_attributes, 1):
-                dataset.append({
-                    'user_id': user_profile['user_id'],
-                    'country': user_profile['country'],
-                    'age_group': user_profile['age_group'],
-                    'occupation': user_profile['occupation'],
-                    'interview_date': interview_dates[i],
-                    'attribute_number': j,
-                    'attribute_text': attribute,
-                    'total_attributes_mentioned': len(user_attributes)
-                })
+            for field in ('user_id', 'country', 'age_group', 'occupation'):
+                columns[field][rows] = user_profile[field]
+            columns['interview_date'][rows] = interview_dates[i]
+            columns['attribute_number'][rows] = np.arange(1, len(user_attributes) + 1)
+            columns['attribute_text'][rows] = user_attributes
+            columns['total_attributes_mentioned'][rows] = len(user_attributes)
+            idx += len(user_attributes)
         
-        return pd.DataFrame(dataset)
+        return pd.DataFrame({field: values[:idx] for field, values in columns.items()}, copy=False)
     
     def analyze_attributes(self, df):
         """Analyze the generated attributes to identify key themes."""
         print("\n🔍 Analyzing Generated Attributes...")
         
-        # Extract all attribute texts
-        all_attributes = df['attribute_text'].tolist()
-        
-        # Perform keyword analysis
-        all_words = []
-        for attr in all_attributes:
-            # Extract meaningful words (length > 3)
-            words = re.findall(r'\b[a-zA-Z]+\b', attr.lower())
-            all_words.extend([word for word in words if len(word) > 3])
-        
-        # Count word frequency
-        word_freq = Counter(all_words)
+        # Count meaningful words (length > 3) straight from the attribute texts
+        word_freq = Counter(
+            word for attr in df['attribute_text'] for word in _WORD_RE.findall(attr.lower())
+        )
         
         print(f"📊 Most mentioned keywords:")
         for word, count in word_freq.most_common(15):
@@ -261,93 +290,28 @@ class QualitativeDatasetGenerator:
     
     def _identify_dimensions(self, word_freq, min_frequency=5):
         """Identify positioning dimensions from word frequency analysis."""
-        dimensions = {}
-        
-        # Camera/Photography dimension
-        camera_keywords = ['camera', 'photo', 'photography', 'pictures', 'video', 'social']
-        camera_score = sum(word_freq.get(word, 0) for word in camera_keywords)
-        if camera_score >= min_frequency:
-            dimensions['Camera_Quality'] = {
-                'keywords': camera_keywords,
-                'frequency': camera_score,
-                'description': 'Photography and video capabilities'
-            }
-        
-        # Battery dimension
-        battery_keywords = ['battery', 'charging', 'power', 'lasting', 'duration']
-        battery_score = sum(word_freq.get(word, 0) for word in battery_keywords)
-        if battery_score >= min_frequency:
-            dimensions['Battery_Life'] = {
-                'keywords': battery_keywords,
-                'frequency': battery_score,
-                'description': 'Battery performance and longevity'
-            }
-        
-        # Performance dimension
-        performance_keywords = ['performance', 'fast', 'speed', 'smooth', 'processing', 'gaming']
-        performance_score = sum(word_freq.get(word, 0) for word in performance_keywords)
-        if performance_score >= min_frequency:
-            dimensions['Performance'] = {
-                'keywords': performance_keywords,
-                'frequency': performance_score,
-                'description': 'Processing speed and responsiveness'
-            }
-        
-        # Price/Value dimension
-        price_keywords = ['price', 'value', 'money', 'affordable', 'cost', 'budget', 'cheap']
-        price_score = sum(word_freq.get(word, 0) for word in price_keywords)
-        if price_score >= min_frequency:
-            dimensions['Price_Value'] = {
-                'keywords': price_keywords,
-                'frequency': price_score,
-                'description': 'Price and value perception'
-            }
+        # Single pass over the vocabulary, crediting each keyword to its dimension
+        scores = defaultdict(int)
+        for word, count in word_freq.items():
+            dimension = self._KEYWORD_TO_DIMENSION.get(word)
+            if dimension:
+                scores[dimension] += count
         
-        # Build Quality dimension
-        quality_keywords = ['quality', 'build', 'durable', 'premium', 'materials', 'construction']
-        quality_score = sum(word_freq.get(word, 0) for word in quality_keywords)
-        if quality_score >= min_frequency:
-            dimensions['Build_Quality'] = {
-                'keywords': quality_keywords,
-                'frequency': quality_score,
-                'description': 'Construction quality and durability'
-            }
-        
-        # Display dimension
-        display_keywords = ['display', 'screen', 'colors', 'clear', 'resolution', 'viewing']
-        display_score = sum(word_freq.get(word, 0) for word in display_keywords)
-        if display_score >= min_frequency:
-            dimensions['Display_Quality'] = {
-                'keywords': display_keywords,
-                'frequency': display_score,
-                'description': 'Screen quality and visual experience'
-            }
-        
-        # Design dimension
-        design_keywords = ['design', 'appearance', 'style', 'aesthetic', 'look', 'attractive']
-        design_score = sum(word_freq.get(word, 0) for word in design_keywords)
-        if design_score >= min_frequency:
-            dimensions['Design_Appeal'] = {
-                'keywords': design_keywords,
-                'frequency': design_score,
-                'description': 'Visual design and aesthetics'
-            }
-        
-        # Features dimension
-        feature_keywords = ['features', 'functionality', 'capabilities', 'functions']
-        feature_score = sum(word_freq.get(word, 0) for word in feature_keywords)
-        if feature_score >= min_frequency:
-            dimensions['Feature_Richness'] = {
-                'keywords': feature_keywords,
-                'frequency': feature_score,
-                'description': 'Breadth of features and functionality'
-            }
+        dimensions = {}
+        for dimension, (keywords, description) in self._DIMENSION_KEYWORDS.items():
+            if scores[dimension] >= min_frequency:
+                dimensions[dimension] = {
+                    'keywords': keywords,
+                    'frequency': scores[dimension],
+                    'description': description
+                }
         
         return dimensions
     
     def export_dataset(self, df, filename='qualitative_user_interviews.csv'):
         """Export dataset to CSV file."""
-        df.to_csv(filename, index=False, encoding='utf-8')
+        df.to_csv(filename, index=False, encoding='utf-8', quoting=csv.QUOTE_MINIMAL,
+                  lineterminator='\n', chunksize=10_000)
         print(f"\n💾 Dataset exported to: {filename}")
         
         # Display dataset summary
@@ -369,10 +333,10 @@ class QualitativeDatasetGenerator:
         print(f"\n💬 Sample User Interviews:")
         print("="*60)
         
-        sample_users = df['user_id'].unique()[:num_samples]
+        # Group once instead of scanning the whole frame for every user
+        groups = df.groupby('user_id', sort=False)
         
-        for i, user_id in enumerate(sample_users, 1):
-            user_data = df[df['user_id'] == user_id]
+        for i, (user_id, user_data) in enumerate(itertools.islice(groups, num_samples), 1):
             first_row = user_data.iloc[0]
             
             print(f"\nInterview #{i}")
@@ -382,8 +346,8 @@ class QualitativeDatasetGenerator:
             print("Researcher: What factors are most important when choosing a smartphone?")
             print("Response:")
             
-            for _, row in user_data.iterrows():
-                print(f"  {row['attribute_number']}. {row['attribute_text']}")
+            for number, text in zip(user_data['attribute_number'], user_data['attribute_text']):
+                print(f"  {number}. {text}")
             
             print("-" * 60)
 
@@ -8,94 +8,177 @@ using Playwright. Provides automated interaction and testing capabilities.
 
 Usage:
     python run_with_playwright.py
+    python run_with_playwright.py --no-cache  # fresh browser profile (CI)
+    PLAYWRIGHT_SLOW_MO=1000 python run_with_playwright.py  # paced demo
 """
 
 import asyncio
-import subprocess
-import time
 import signal
 import sys
 import os
+import functools
+import atexit
+import logging
+import logging.handlers
+import queue
 from pathlib import Path
-from playwright.async_api import async_playwright
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+
+logger = logging.getLogger(__name__)
+
+# Log lines that mean the server is accepting connections (Flask, waitress)
+SERVER_READY_BANNERS = (b"Running on http", b"Serving on http")
+SERVER_START_TIMEOUT = 10  # seconds
+
+# Per-action delay in ms; opt in with PLAYWRIGHT_SLOW_MO for a watchable demo
+SLOW_MO = int(os.environ.get('PLAYWRIGHT_SLOW_MO', '0'))
+
+# Persistent Chromium profile so repeat runs start with a warm HTTP cache
+PROFILE_DIR = '.playwright-profile'
+
+# Page states the demo waits on instead of sleeping for a fixed time
+TEXT_VALIDATED_JS = "() => document.getElementById('word-counter').classList.length > 1"
+UPLOAD_PROCESSED_JS = "() => !document.getElementById('quantitative-summary').classList.contains('hidden')"
+
+@functools.lru_cache(maxsize=1)
+def _sample_text():
+    """Read the sample qualitative text once per process."""
+    return Path('test_sample_data.txt').read_text(encoding='utf-8')
+
+def _start_logging():
+    """Send log output through a queue so stdout writes happen on a listener thread.
+    
+    Set LOG_LEVEL=WARNING (e.g. in CI) to only see problems.
+    """
+    log_queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+    logger.propagate = False
+    
+    listener.start()
+    atexit.register(listener.stop)  # sys.exit paths still flush the queue
 
 class PlaywrightWebRunner:
     """Run the upload system with Playwright browser automation."""
     
-    def __init__(self):
+    def __init__(self, use_profile=True):
+        self.use_profile = use_profile
         self.server_process = None
+        self._output_task = None
         self.server_url = "http://localhost:8080"
         
     async def start_server(self):
         """Start the Flask server in background."""
-        print("🔄 Starting Flask server...")
+        logger.info("🔄 Starting Flask server...")
         
-        # Activate venv and start server
+        # Run the server with the venv's interpreter directly, no shell needed.
+        # VIRTUAL_ENV/PATH are set the way `source venv/bin/activate` would.
         server_script = Path("enhanced_upload_interface.py").resolve()
+        venv_dir = Path("venv").resolve()
+        python_bin = venv_dir / "bin" / "python"
+        env = dict(os.environ, PYTHONUNBUFFERED='1')  # Banner arrives as soon as it is printed
+        if python_bin.exists():
+            env['VIRTUAL_ENV'] = str(venv_dir)
+            env['PATH'] = f"{venv_dir / 'bin'}{os.pathsep}{env.get('PATH', '')}"
+        else:
+            # No local venv: fall back to the interpreter running this script
+            python_bin = Path(sys.executable)
         
-        # Use shell with venv activation
-        cmd = f"source venv/bin/activate && python {server_script}"
-        
-        self.server_process = subprocess.Popen(
-            cmd,
-            shell=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+        self.server_process = await asyncio.create_subprocess_exec(
+            str(python_bin), str(server_script),
+            env=env,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
             preexec_fn=os.setsid  # Create new process group
         )
         
-        # Wait for server to start
-        print("⏳ Waiting for server to start...")
-        await asyncio.sleep(3)
+        # Wait for the server to announce it is listening
+        logger.info("⏳ Waiting for server to start...")
+        output = []
+        try:
+            ready = await asyncio.wait_for(self._wait_banner(output), timeout=SERVER_START_TIMEOUT)
+        except asyncio.TimeoutError:
+            ready = False
         
-        if self.server_process.poll() is not None:
+        if not ready:
             # Server failed to start
-            stdout, stderr = self.server_process.communicate()
-            print(f"❌ Server failed to start:")
-            print(f"STDOUT: {stdout.decode()}")
-            print(f"STDERR: {stderr.decode()}")
+            logger.error(f"❌ Server failed to start:")
+            logger.error(f"OUTPUT: {b''.join(output).decode(errors='replace')}")
+            await self.stop_server()
             return False
         
-        print(f"✅ Server started at {self.server_url}")
+        # Keep draining server output so a full pipe never blocks it
+        self._output_task = asyncio.create_task(self._drain_server_output())
+        
+        logger.info(f"✅ Server started at {self.server_url}")
         return True
     
-    def stop_server(self):
+    async def _wait_banner(self, output):
+        """Read server output until a ready banner shows up.
+        
+        Lines read are appended to output so a failed start can be reported.
+        Returns False if the output closes first, i.e. the server exited.
+        """
+        async for line in self.server_process.stdout:
+            output.append(line)
+            if any(banner in line for banner in SERVER_READY_BANNERS):
+                return True
+        return False
+    
+    async def _drain_server_output(self):
+        """Discard server log lines once startup has been confirmed."""
+        async for _ in self.server_process.stdout:
+            pass
+    
+    def _signal_server(self, sig):
+        """Send a signal to the server's whole process group."""
+        try:
+            os.killpg(os.getpgid(self.server_process.pid), sig)
+        except ProcessLookupError:
+            pass
+    
+    async def stop_server(self):
         """Stop the Flask server."""
-        if self.server_process:
-            print("🛑 Stopping Flask server...")
+        if self.server_process and self.server_process.returncode is None:
+            logger.info("🛑 Stopping Flask server...")
+            # Kill the entire process group
+            self._signal_server(signal.SIGTERM)
             try:
-                # Kill the entire process group
-                os.killpg(os.getpgid(self.server_process.pid), signal.SIGTERM)
-                self.server_process.wait(timeout=5)
-            except (ProcessLookupError, subprocess.TimeoutExpired):
+                await asyncio.wait_for(self.server_process.wait(), timeout=5)
+            except asyncio.TimeoutError:
                 # Force kill if needed
-                try:
-                    os.killpg(os.getpgid(self.server_process.pid), signal.SIGKILL)
-                except ProcessLookupError:
-                    pass
-            print("✅ Server stopped")
+                self._signal_server(signal.SIGKILL)
+                await self.server_process.wait()
+            logger.info("✅ Server stopped")
     
     async def run_browser_session(self):
         """Run interactive browser session with the upload interface."""
         async with async_playwright() as p:
             # Launch browser
-            print("🌐 Launching browser...")
-            browser = await p.chromium.launch(headless=False, slow_mo=1000)
-            context = await browser.new_context()
-            page = await context.new_page()
+            logger.info("🌐 Launching browser...")
+            if self.use_profile:
+                context = await p.chromium.launch_persistent_context(PROFILE_DIR, headless=False, slow_mo=SLOW_MO)
+            else:
+                browser = await p.chromium.launch(headless=False, slow_mo=SLOW_MO)
+                context = await browser.new_context()
+            page = context.pages[0] if context.pages else await context.new_page()
             
             try:
                 # Navigate to the upload interface
-                print(f"📱 Opening {self.server_url}")
+                logger.info(f"📱 Opening {self.server_url}")
                 await page.goto(self.server_url)
                 
                 # Wait for page to load
                 await page.wait_for_selector('h1', timeout=10000)
                 
-                print("✅ Upload interface loaded successfully!")
-                print("\n" + "="*60)
-                print("🎯 INTERACTIVE DEMO STARTING")
-                print("="*60)
+                logger.info("✅ Upload interface loaded successfully!")
+                logger.info("\n" + "="*60)
+                logger.info("🎯 INTERACTIVE DEMO STARTING")
+                logger.info("="*60)
                 
                 # Demo Step 1: Show qualitative data input
                 await self.demo_qualitative_input(page)
@@ -110,33 +193,47 @@ class PlaywrightWebRunner:
                 await self.demo_final_results(page)
                 
                 # Keep browser open for user interaction
-                print("\n🎉 Demo completed!")
-                print("💡 The browser will stay open for you to explore the interface")
-                print("🔧 You can now upload your own data and test all features")
-                print("\nPress Ctrl+C to close when done...")
+                logger.info("\n🎉 Demo completed!")
+                logger.info("💡 The browser will stay open for you to explore the interface")
+                logger.info("🔧 You can now upload your own data and test all features")
+                logger.info("\nPress Ctrl+C to close when done...")
                 
-                # Wait indefinitely until user closes
+                # Wait until the user closes the page or the browser
+                closed = asyncio.get_running_loop().create_future()
+                def _on_close(_):
+                    if not closed.done():
+                        closed.set_result(None)
+                page.on("close", _on_close)
+                context.on("close", _on_close)
                 try:
-                    while not page.is_closed():
-                        await asyncio.sleep(1)
+                    if not page.is_closed():
+                        await closed
                 except KeyboardInterrupt:
-                    print("\n👋 Closing browser...")
+                    logger.info("\n👋 Closing browser...")
                 
             except Exception as e:
-                print(f"❌ Browser session error: {e}")
+                logger.error(f"❌ Browser session error: {e}")
                 
             finally:
-                await browser.close()
+                await context.close()
+                if context.browser:
+                    await context.browser.close()
+    
+    async def _wait_until_idle(self, page, timeout=2000):
+        """Return as soon as the page is network-idle, waiting at most timeout ms."""
+        try:
+            await page.wait_for_load_state('networkidle', timeout=timeout)
+        except PlaywrightTimeoutError:
+            pass
     
     async def demo_qualitative_input(self, page):
         """Demonstrate qualitative data input."""
-        print("\n📝 DEMO: Qualitative Data Input")
-        print("-" * 40)
+        logger.info("\n📝 DEMO: Qualitative Data Input")
+        logger.info("-" * 40)
         
-        # Load sample qualitative text
+        # Load sample qualitative text off the event loop
         try:
-            with open('test_sample_data.txt', 'r', encoding='utf-8') as f:
-                sample_text = f.read()
+            sample_text = await asyncio.to_thread(_sample_text)
         except FileNotFoundError:
             sample_text = """Sample qualitative research data for demonstration.
             
@@ -146,23 +243,28 @@ class PlaywrightWebRunner:
         textarea = page.locator('#qualitative-text')
         await textarea.fill(sample_text)
         
-        print("✅ Sample qualitative data entered")
-        print(f"📊 Text length: {len(sample_text)} characters")
+        logger.info("✅ Sample qualitative data entered")
+        logger.info(f"📊 Text length: {len(sample_text)} characters")
         
-        # Wait to see real-time validation
-        await asyncio.sleep(2)
+        # Wait for the real-time validation response
+        try:
+            await page.wait_for_function(TEXT_VALIDATED_JS, timeout=3000)
+        except PlaywrightTimeoutError:
+            logger.warning("⚠️  Real-time validation did not respond")
         
         # Validate the text
         validate_btn = page.locator('#validate-text-btn')
-        if await validate_btn.is_visible():
-            await validate_btn.click()
-            print("✅ Text validation triggered")
-            await asyncio.sleep(1)
+        try:
+            await validate_btn.click(timeout=1000)
+            logger.info("✅ Text validation triggered")
+            await self._wait_until_idle(page)
+        except PlaywrightTimeoutError:
+            logger.warning("⚠️  Validate button not actionable")
     
     async def demo_industry_context(self, page):
         """Demonstrate industry context input."""
-        print("\n🏭 DEMO: Industry Context Input")
-        print("-" * 40)
+        logger.info("\n🏭 DEMO: Industry Context Input")
+        logger.info("-" * 40)
         
         context_text = "Premium smartphone market targeting professionals aged 25-45. Key competitors include Apple, Samsung, Google. Focus on camera quality, performance, and business features."
         
@@ -170,56 +272,63 @@ class PlaywrightWebRunner:
         context_input = page.locator('#industry-context')
         await context_input.fill(context_text)
         
-        print("✅ Industry context entered")
-        print(f"📊 Context length: {len(context_text)} characters")
+        logger.info("✅ Industry context entered")
+        logger.info(f"📊 Context length: {len(context_text)} characters")
         
         # Save context
         save_btn = page.locator('#save-context-btn')
-        if await save_btn.is_visible():
-            await save_btn.click()
-            print("✅ Context saved")
-            await asyncio.sleep(1)
+        try:
+            await save_btn.click(timeout=1000)
+            logger.info("✅ Context saved")
+            await self._wait_until_idle(page)
+        except PlaywrightTimeoutError:
+            logger.warning("⚠️  Save button not actionable")
     
     async def demo_file_upload(self, page):
         """Demonstrate file upload functionality."""
-        print("\n📊 DEMO: File Upload Simulation")
-        print("-" * 40)
+        logger.info("\n📊 DEMO: File Upload Simulation")
+        logger.info("-" * 40)
         
         # Check if quantitative file exists
         if os.path.exists('test_large_survey.csv'):
-            print("✅ Found sample CSV file")
+            logger.info("✅ Found sample CSV file")
             
             # Get file input element
             file_input = page.locator('#quantitative-file')
             
             # Upload the file
             await file_input.set_input_files('test_large_survey.csv')
-            print("✅ Sample CSV file uploaded")
+            logger.info("✅ Sample CSV file uploaded")
             
-            # Wait for processing
-            await asyncio.sleep(2)
+            # Wait for the upload summary to appear
+            try:
+                await page.wait_for_function(UPLOAD_PROCESSED_JS, timeout=5000)
+            except PlaywrightTimeoutError:
+                logger.warning("⚠️  Upload summary did not appear")
             
         else:
-            print("⚠️  No sample CSV file found - skipping file upload demo")
+            logger.warning("⚠️  No sample CSV file found - skipping file upload demo")
     
     async def demo_final_results(self, page):
         """Show final results and analysis options."""
-        print("\n🎯 DEMO: Analysis Options")
-        print("-" * 40)
+        logger.info("\n🎯 DEMO: Analysis Options")
+        logger.info("-" * 40)
         
-        # Check if analysis button is enabled
+        # click() waits for the button to be visible and enabled in one call
         analysis_btn = page.locator('#generate-analysis-btn')
         
-        if await analysis_btn.is_visible():
-            is_enabled = await analysis_btn.is_enabled()
-            if is_enabled:
-                await analysis_btn.click()
-                print("✅ Analysis generation triggered")
-                await asyncio.sleep(2)
-            else:
-                print("⚠️  Analysis button not enabled - may need more data")
+        try:
+            await analysis_btn.click(timeout=1000)
+        except PlaywrightTimeoutError:
+            logger.warning("⚠️  Analysis button not actionable - may need more data")
+        else:
+            logger.info("✅ Analysis generation triggered")
+            try:
+                await page.wait_for_selector('#analysis-options', state='visible', timeout=5000)
+            except PlaywrightTimeoutError:
+                logger.warning("⚠️  Analysis options did not appear")
         
-        print("✅ Demo sequence completed")
+        logger.info("✅ Demo sequence completed")
     
     async def run(self):
         """Run the complete Playwright session."""
@@ -232,33 +341,34 @@ class PlaywrightWebRunner:
             await self.run_browser_session()
             
         except KeyboardInterrupt:
-            print("\n👋 Session interrupted by user")
+            logger.info("\n👋 Session interrupted by user")
         except Exception as e:
-            print(f"❌ Error during session: {e}")
+            logger.error(f"❌ Error during session: {e}")
         finally:
-            self.stop_server()
+            await self.stop_server()
         
         return True
 
 async def main():
     """Main execution function."""
-    print("🎭 Playwright Web Interface Runner")
-    print("=" * 50)
-    print("This will:")
-    print("1. ✅ Start the Flask upload server")
-    print("2. ✅ Launch browser with Playwright")  
-    print("3. ✅ Open the upload interface")
-    print("4. ✅ Run interactive demo")
-    print("5. ✅ Keep browser open for exploration")
-    print("\nPress Ctrl+C anytime to stop")
-    print("=" * 50)
+    logger.info("🎭 Playwright Web Interface Runner")
+    logger.info("=" * 50)
+    logger.info("This will:")
+    logger.info("1. ✅ Start the Flask upload server")
+    logger.info("2. ✅ Launch browser with Playwright")
+    logger.info("3. ✅ Open the upload interface")
+    logger.info("4. ✅ Run interactive demo")
+    logger.info("5. ✅ Keep browser open for exploration")
+    logger.info("\nPress Ctrl+C anytime to stop")
+    logger.info("=" * 50)
     
-    runner = PlaywrightWebRunner()
+    runner = PlaywrightWebRunner(use_profile='--no-cache' not in sys.argv)
     
     # Setup signal handler for clean shutdown
     def signal_handler(signum, frame):
-        print("\n🛑 Received shutdown signal")
-        runner.stop_server()
+        logger.info("\n🛑 Received shutdown signal")
+        if runner.server_process and runner.server_process.returncode is None:
+            runner._signal_server(signal.SIGTERM)
         sys.exit(0)
     
     signal.signal(signal.SIGINT, signal_handler)
@@ -267,17 +377,18 @@ async def main():
     success = await runner.run()
     
     if success:
-        print("\n🎉 Playwright session completed successfully!")
+        logger.info("\n🎉 Playwright session completed successfully!")
     else:
-        print("\n❌ Playwright session failed")
+        logger.error("\n❌ Playwright session failed")
         return 1
     
     return 0
 
 if __name__ == "__main__":
+    _start_logging()
     try:
         exit_code = asyncio.run(main())
         sys.exit(exit_code)
     except KeyboardInterrupt:
-        print("\n👋 Goodbye!")
+        logger.info("\n👋 Goodbye!")
         sys.exit(0)
\ No newline at end of file
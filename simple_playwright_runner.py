@@ -12,70 +12,186 @@ Usage:
     
     # Terminal 2: Launch browser
     source venv/bin/activate && python simple_playwright_runner.py
+    
+    # Fresh browser profile instead of the cached one (CI)
+    python simple_playwright_runner.py --no-cache
+    
+    # Watchable demo with paced actions
+    INTERACTIVE=1 PLAYWRIGHT_SLOW_MO=500 python simple_playwright_runner.py
 """
 
 import asyncio
-from playwright.async_api import async_playwright
-import requests
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+from contextlib import asynccontextmanager
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+import aiohttp
+import sys
 import time
 
-async def check_server(url, max_retries=10):
-    """Check if server is running."""
+logger = logging.getLogger(__name__)
+
+# Per-action delay in ms; opt in with PLAYWRIGHT_SLOW_MO for a watchable demo
+SLOW_MO = int(os.environ.get('PLAYWRIGHT_SLOW_MO', '0'))
+
+# Human-visible pauses only when INTERACTIVE is set, so CI runs pay no pacing cost
+INTERACTIVE = bool(os.environ.get('INTERACTIVE'))
+
+# Persistent Chromium profile so repeat runs start with a warm HTTP cache
+PROFILE_DIR = '.playwright-profile'
+
+# Set once the server has answered the real-time text validation request
+TEXT_VALIDATED_JS = "() => document.getElementById('word-counter').classList.length > 1"
+
+# HTTP session shared by every probe so keep-alive connections are reused
+_http_session = None
+
+def _get_http_session():
+    """Return the shared aiohttp session, creating it inside the running loop."""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        connector = aiohttp.TCPConnector(limit=8, keepalive_timeout=30)
+        _http_session = aiohttp.ClientSession(connector=connector)
+    return _http_session
+
+async def close_http_session():
+    """Close the shared HTTP session and its pooled connections."""
+    global _http_session
+    if _http_session is not None:
+        await _http_session.close()
+        _http_session = None
+
+def _start_logging():
+    """Emit log records through a queue drained by a background thread.
+    
+    The demo coroutines only enqueue; the listener thread does the stdout
+    writes. LOG_LEVEL=WARNING keeps CI output to problems only.
+    """
+    log_queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+    logger.propagate = False
+    
+    listener.start()
+    atexit.register(listener.stop)  # Flush whatever is still queued
+
+async def check_server(url, max_retries=15):
+    """Check if server is running.
+    
+    Probes without blocking the event loop, backing off from 0.1s to 1s
+    between attempts so a server that is already up is found immediately.
+    """
+    session = _get_http_session()
+    timeout = aiohttp.ClientTimeout(total=0.5)
     for i in range(max_retries):
         try:
-            response = requests.get(url, timeout=2)
-            if response.status_code == 200:
-                return True
-        except:
+            async with session.get(url, timeout=timeout) as response:
+                if response.status == 200:
+                    return True
+        except (aiohttp.ClientError, asyncio.TimeoutError):
             pass
         
         if i < max_retries - 1:
-            print(f"⏳ Waiting for server... ({i+1}/{max_retries})")
-            await asyncio.sleep(1)
+            logger.info(f"⏳ Waiting for server... ({i+1}/{max_retries})")
+            await asyncio.sleep(min(0.1 * 2 ** i, 1.0))
     
     return False
 
-async def run_browser_demo():
+# Browsers launched by _get_browser, keyed by use_profile, plus their driver
+_playwright = None
+_browsers = {}
+
+async def _get_browser(use_profile=True):
+    """Launch Chromium once per process and return the cached instance.
+    
+    With a profile the persistent context itself plays the browser role;
+    otherwise this is a regular Browser that hands out fresh contexts.
+    """
+    global _playwright
+    browser = _browsers.get(use_profile)
+    if browser is None:
+        if _playwright is None:
+            _playwright = await async_playwright().start()
+        logger.info("🌐 Launching browser...")
+        launch_options = dict(
+            headless=False,  # Show browser window
+            slow_mo=SLOW_MO  # Slow down actions for visibility
+        )
+        if use_profile:
+            browser = await _playwright.chromium.launch_persistent_context(PROFILE_DIR, **launch_options)
+        else:
+            browser = await _playwright.chromium.launch(**launch_options)
+        _browsers[use_profile] = browser
+    return browser
+
+@asynccontextmanager
+async def browser_session(use_profile=True):
+    """Yield (browser, context, page) on the shared browser.
+    
+    Only what the session opened is closed on exit; the browser stays up
+    for the next session until close_browser() is called.
+    """
+    browser = await _get_browser(use_profile)
+    if use_profile:
+        context = browser
+        page = context.pages[0] if context.pages else await context.new_page()
+        yield browser, context, page
+    else:
+        context = await browser.new_context()
+        try:
+            yield browser, context, await context.new_page()
+        finally:
+            await context.close()
+
+async def close_browser():
+    """Shut down every cached browser and the Playwright driver."""
+    global _playwright
+    while _browsers:
+        _, browser = _browsers.popitem()
+        await browser.close()
+    if _playwright is not None:
+        await _playwright.stop()
+        _playwright = None
+
+async def run_browser_demo(use_profile=True):
     """Run browser automation demo."""
     server_url = "http://localhost:8080"
     
     # Check if server is running
-    print("🔍 Checking if server is running...")
+    logger.info("🔍 Checking if server is running...")
     if not await check_server(server_url):
-        print(f"❌ Server not running at {server_url}")
-        print("Please start the server first:")
-        print("   source venv/bin/activate")
-        print("   python enhanced_upload_interface.py")
+        logger.error(f"❌ Server not running at {server_url}")
+        logger.error("Please start the server first:")
+        logger.error("   source venv/bin/activate")
+        logger.error("   python enhanced_upload_interface.py")
         return False
     
-    print("✅ Server is running!")
+    logger.info("✅ Server is running!")
     
-    # Launch browser
-    async with async_playwright() as p:
-        print("🌐 Launching browser...")
-        browser = await p.chromium.launch(
-            headless=False,  # Show browser window
-            slow_mo=500      # Slow down actions for visibility
-        )
-        
-        context = await browser.new_context()
-        page = await context.new_page()
-        
+    # Reuse the process-wide browser instead of booting Chromium per demo
+    async with browser_session(use_profile) as (browser, context, page):
         try:
             # Navigate to upload interface
-            print(f"📱 Opening {server_url}")
+            logger.info(f"📱 Opening {server_url}")
             await page.goto(server_url)
             
             # Wait for page to load
             await page.wait_for_load_state('networkidle')
             
-            print("🎯 Upload interface loaded!")
-            print("\n" + "="*50)
-            print("🎭 STARTING AUTOMATED DEMO")
-            print("="*50)
+            logger.info("🎯 Upload interface loaded!")
+            logger.info("\n" + "="*50)
+            logger.info("🎭 STARTING AUTOMATED DEMO")
+            logger.info("="*50)
             
             # Demo Step 1: Fill qualitative data
-            print("\n📝 Step 1: Adding qualitative data...")
+            logger.info("\n📝 Step 1: Adding qualitative data...")
             
             sample_text = """
             User feedback indicates that camera quality is the most important factor when choosing a smartphone. Many users specifically mention the need for excellent photo capabilities for social media sharing.
@@ -95,34 +211,30 @@ async def run_browser_demo():
             Design appeal and aesthetics matter for devices used daily in public. Modern, stylish designs are preferred over outdated looks.
             """
             
-            # Find and fill the textarea
-            textarea = page.locator('#qualitative-text')
-            await textarea.fill(sample_text.strip())
-            
-            # Wait to see real-time validation
-            print("⏳ Watching real-time validation...")
-            await asyncio.sleep(3)
-            
             # Demo Step 2: Add industry context
-            print("\n🏭 Step 2: Adding industry context...")
+            logger.info("\n🏭 Step 2: Adding industry context...")
             
             context_text = "Premium smartphone market targeting professionals aged 25-45. Key competitors include Apple, Samsung, Google. Focus on camera quality, performance, and business features."
             
-            context_input = page.locator('#industry-context')
-            await context_input.fill(context_text)
-            
-            await asyncio.sleep(2)
-            
             # Demo Step 3: Simulate GenAI service selection
-            print("\n🤖 Step 3: Showing GenAI options...")
+            logger.info("\n🤖 Step 3: Showing GenAI options...")
             
-            service_select = page.locator('#genai-service')
-            await service_select.select_option('openai')
+            # The three inputs are independent, so fill them concurrently
+            await asyncio.gather(
+                page.locator('#qualitative-text').fill(sample_text.strip()),
+                page.locator('#industry-context').fill(context_text),
+                page.locator('#genai-service').select_option('openai')
+            )
             
-            await asyncio.sleep(1)
+            # Wait for the real-time validation response
+            logger.info("⏳ Watching real-time validation...")
+            try:
+                await page.wait_for_function(TEXT_VALIDATED_JS, timeout=3000)
+            except PlaywrightTimeoutError:
+                logger.warning("⚠️  Real-time validation did not respond")
             
             # Demo Step 4: Show file upload area
-            print("\n📊 Step 4: Highlighting file upload area...")
+            logger.info("\n📊 Step 4: Highlighting file upload area...")
             
             # Scroll to quantitative section
             quantitative_section = page.locator('#step4')
@@ -132,56 +244,59 @@ async def run_browser_demo():
             drop_zone = page.locator('#quantitative-drop')
             await drop_zone.hover()
             
-            await asyncio.sleep(2)
+            if INTERACTIVE:
+                await asyncio.sleep(2)
             
-            print("\n🎉 Demo completed!")
-            print("💡 The interface is now ready for your interaction")
-            print("📁 You can upload your own files and test all features")
-            print("🔧 Try dragging CSV files to the upload areas")
-            print("\n⌨️  Press Enter to close browser, or interact directly with the interface...")
+            logger.info("\n🎉 Demo completed!")
+            logger.info("💡 The interface is now ready for your interaction")
+            logger.info("📁 You can upload your own files and test all features")
+            logger.info("🔧 Try dragging CSV files to the upload areas")
+            logger.info("\n⌨️  Press Enter to close browser, or interact directly with the interface...")
             
             # Wait for user input or interaction
             try:
                 # Check if running in interactive mode
-                import sys
                 if sys.stdin.isatty():
                     input()  # Wait for user to press Enter
-                else:
-                    # Non-interactive mode, wait longer
+                elif INTERACTIVE:
+                    # No terminal attached, keep the window up for a while
                     await asyncio.sleep(30)
             except:
-                await asyncio.sleep(10)
+                if INTERACTIVE:
+                    await asyncio.sleep(10)
             
         except Exception as e:
-            print(f"❌ Demo error: {e}")
-            await asyncio.sleep(5)  # Keep browser open briefly to see error
-            
-        finally:
-            print("👋 Closing browser...")
-            await browser.close()
+            logger.error(f"❌ Demo error: {e}")
+            if INTERACTIVE:
+                await asyncio.sleep(5)  # Keep browser open briefly to see error
     
     return True
 
 async def main():
     """Main execution."""
-    print("🎭 Simple Playwright Browser Launcher")
-    print("=" * 40)
-    print("This will open the upload interface in a browser")
-    print("and run an automated demo to show the features.")
-    print("=" * 40)
+    logger.info("🎭 Simple Playwright Browser Launcher")
+    logger.info("=" * 40)
+    logger.info("This will open the upload interface in a browser")
+    logger.info("and run an automated demo to show the features.")
+    logger.info("=" * 40)
     
     try:
-        success = await run_browser_demo()
+        success = await run_browser_demo(use_profile='--no-cache' not in sys.argv)
         
         if success:
-            print("\n✅ Browser demo completed!")
+            logger.info("\n✅ Browser demo completed!")
         else:
-            print("\n❌ Demo failed - make sure server is running")
+            logger.error("\n❌ Demo failed - make sure server is running")
             
     except KeyboardInterrupt:
-        print("\n👋 Demo interrupted by user")
+        logger.info("\n👋 Demo interrupted by user")
     except Exception as e:
-        print(f"\n❌ Error: {e}")
+        logger.error(f"\n❌ Error: {e}")
+    finally:
+        logger.info("👋 Closing browser...")
+        await close_browser()
+        await close_http_session()
 
 if __name__ == "__main__":
+    _start_logging()
     asyncio.run(main())
\ No newline at end of file
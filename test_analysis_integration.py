@@ -7,9 +7,41 @@ Test the complete integration between file upload, validation, and analysis gene
 This will help identify and fix the analysis failure issue.
 """
 
+# Select the non-interactive backend before anything imports pyplot
+import matplotlib
+matplotlib.use('Agg')
+
 import pandas as pd
 import sys
 import os
+import functools
+
+SURVEY_PATH = 'test_large_survey.csv'
+
+def _survey_signature(path=SURVEY_PATH):
+    """Cache key for everything derived from the survey file."""
+    return (path, os.path.getmtime(path))
+
+@functools.lru_cache(maxsize=8)
+def _survey_df(sig):
+    """Parse the sample survey once and share it between tests (read-only).
+    
+    Uses pd.read_csv, as the upload path does, so validation and analysis
+    see the same types they get in production.
+    """
+    return pd.read_csv(sig[0])
+
+@functools.lru_cache(maxsize=8)
+def _cached_validation(sig):
+    """Validate the survey once per file version."""
+    from data_upload_system import DataUploadSystem
+    return DataUploadSystem()._validate_quantitative_data(_survey_df(sig), 'CSV')
+
+@functools.lru_cache(maxsize=8)
+def _cached_analyzer(sig):
+    """Build the analyzer once per file version."""
+    from perceptual_map_analyzer import PerceptualMapAnalyzer
+    return PerceptualMapAnalyzer(_survey_df(sig), include_popularity=True)
 
 def test_data_flow():
     """Test the complete data flow from upload to analysis."""
@@ -19,7 +51,8 @@ def test_data_flow():
     # Step 1: Test CSV reading
     print("\n📊 Step 1: Testing CSV Data Loading")
     try:
-        df = pd.read_csv('test_large_survey.csv')
+        sig = _survey_signature()
+        df = _survey_df(sig)
         print(f"✅ CSV loaded: {len(df)} rows, {len(df.columns)} columns")
         print(f"📋 Columns: {list(df.columns)}")
     except Exception as e:
@@ -29,10 +62,7 @@ def test_data_flow():
     # Step 2: Test data validation
     print("\n🔍 Step 2: Testing Data Validation")
     try:
-        from data_upload_system import DataUploadSystem
-        system = DataUploadSystem()
-        
-        result = system._validate_quantitative_data(df, 'CSV')
+        result = _cached_validation(sig)
         
         if result.is_valid:
             print(f"✅ Data validation passed: {result.message}")
@@ -50,8 +80,7 @@ def test_data_flow():
     # Step 3: Test analyzer creation
     print("\n🎯 Step 3: Testing Analyzer Creation")
     try:
-        from perceptual_map_analyzer import PerceptualMapAnalyzer
-        analyzer = PerceptualMapAnalyzer(df, include_popularity=True)
+        analyzer = _cached_analyzer(sig)
         
         print(f"✅ Analyzer created successfully")
         print(f"📊 Dimensions found: {len(analyzer.dimensions)}")
@@ -92,9 +121,6 @@ def test_data_flow():
             print(f"📊 Attempting to create map: {x_dim} vs {y_dim}")
             
             # Test without actually showing the plot (headless)
-            import matplotlib
-            matplotlib.use('Agg')  # Use non-interactive backend
-            
             fig, ax = analyzer.create_perceptual_map(
                 x_dim, y_dim,
                 save_path=None  # Don't save, just test creation
@@ -119,7 +145,7 @@ def test_web_interface_data():
     print("-" * 40)
     
     try:
-        df = pd.read_csv('test_large_survey.csv')
+        df = _survey_df(_survey_signature())
         
         # Convert to the format expected by web interface
         data_for_web = df.to_dict('records')
@@ -148,7 +174,7 @@ def main():
     print("=" * 50)
     
     # Check if test files exist
-    required_files = ['test_large_survey.csv']
+    required_files = [SURVEY_PATH]
     missing_files = [f for f in required_files if not os.path.exists(f)]
     
     if missing_files:
@@ -164,6 +190,8 @@ def main():
     passed = 0
     failed = 0
     
+    # test_data_flow draws with pyplot, which is not thread-safe, so the
+    # tests run one after another
     for test_name, test_func in tests:
         print(f"\n🔬 Running: {test_name}")
         print("-" * 30)
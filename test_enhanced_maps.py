@@ -1,19 +1,50 @@
 #!/usr/bin/env python3
 """
 Test enhanced perceptual maps with realistic data
+
+Usage:
+    python test_enhanced_maps.py           # render every map
+    python test_enhanced_maps.py --reuse   # keep maps rendered from unchanged data and code
 """
+import hashlib
+import inspect
+import sys
+from pathlib import Path
+import matplotlib
+matplotlib.use('Agg')  # Before pyplot loads; spawned workers re-run this on import
 import pandas as pd
+import data_driven_analyzer
 from data_driven_analyzer import DataDrivenAnalyzer
 import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor
+
+DATA_PATH = 'example_flexible_data.csv'
+
+def _render(x_dim, y_dim, csv_path, out_path):
+    """Render one map in a worker process; returns the saved path."""
+    analyzer = DataDrivenAnalyzer(pd.read_csv(csv_path))
+    fig, ax = analyzer.create_perceptual_map(x_dim, y_dim, save_path=out_path)
+    plt.close(fig)  # Clean up
+    return out_path
+
+def _cache_key(df):
+    """Short hash of the data and the map-drawing code, used to tag map files."""
+    digest = hashlib.sha256(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    digest.update(inspect.getsource(data_driven_analyzer).encode())
+    return digest.hexdigest()[:8]
 
-def test_enhanced_maps():
-    """Test the enhanced map generation with realistic data."""
+def test_enhanced_maps(reuse=False):
+    """Test the enhanced map generation with realistic data.
+    
+    Every map is rendered unless reuse is set, in which case maps already
+    rendered from identical data and drawing code are kept.
+    """
     print("🧪 Testing Enhanced Perceptual Maps")
     print("=" * 40)
     
     # Load the example data
     try:
-        df = pd.read_csv('example_flexible_data.csv')
+        df = pd.read_csv(DATA_PATH)
         print(f"✅ Loaded data: {len(df)} services")
         
         # Create analyzer
@@ -31,19 +62,32 @@ def test_enhanced_maps():
             ('brand_trust', 'innovation', 'Trust vs Innovation')
         ]
         
+        key = _cache_key(df)
+        jobs = []
         for x_dim, y_dim, description in test_combinations:
             if x_dim in summary['available_dimensions'] and y_dim in summary['available_dimensions']:
-                print(f"\n🎨 Creating {description} map...")
-                
-                # Create enhanced map
-                filename = f"enhanced_{x_dim}_vs_{y_dim}_test.png"
-                fig, ax = analyzer.create_perceptual_map(
-                    x_dim, y_dim, 
-                    save_path=f"results/{filename}"
-                )
+                filename = f"enhanced_{x_dim}_vs_{y_dim}_{key}.png"
+                if reuse and Path('results', filename).exists():
+                    print(f"\n♻️  {description} map unchanged, reusing {filename}")
+                    continue
+                # Keep one copy per map: drop copies tagged with an older key
+                for stale in Path('results').glob(f"enhanced_{x_dim}_vs_{y_dim}_*.png"):
+                    stale.unlink()
+                jobs.append((x_dim, y_dim, description, filename))
+        
+        # Rendering is CPU-bound matplotlib work, so give each map its own process
+        if jobs:
+            with ProcessPoolExecutor(max_workers=len(jobs)) as executor:
+                futures = []
+                for x_dim, y_dim, description, filename in jobs:
+                    print(f"\n🎨 Creating {description} map...")
+                    futures.append((filename, executor.submit(
+                        _render, x_dim, y_dim, DATA_PATH, f"results/{filename}"
+                    )))
                 
-                plt.close(fig)  # Clean up
-                print(f"   ✅ Saved: {filename}")
+                for filename, future in futures:
+                    future.result()
+                    print(f"   ✅ Saved: {filename}")
                 
         print(f"\n🎉 Enhanced maps created! Key improvements:")
         print(f"   • Professional brand colors")
@@ -57,8 +101,5 @@ def test_enhanced_maps():
         print(f"❌ Error: {e}")
 
 if __name__ == "__main__":
-    # Set matplotlib backend for headless operation
-    import matplotlib
-    matplotlib.use('Agg')
-    
-    test_enhanced_maps()
\ No newline at end of file
+    # --reuse keeps maps whose data and drawing code are unchanged
+    test_enhanced_maps(reuse='--reuse' in sys.argv)
\ No newline at end of file
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test GenAI Integration
+======================
+
+Offline tests for keyword extraction plumbing. API calls are replaced by a
+stub extractor, so no network access or API keys are needed.
+"""
+
+from genai_integration import GenAIExtractor, BatchedExtractor
+
+class StubExtractor(GenAIExtractor):
+    """Extractor whose OpenAI completion returns canned responses."""
+
+    def __init__(self):
+        super().__init__()
+        self.prompts = []
+
+    def _complete_openai(self, prompt, api_key, max_tokens=300):
+        self.prompts.append(prompt)
+        if 'RESULT [' in prompt:
+            # Answer excerpts A and B only, leaving C to the fallback path
+            return "RESULT [A]:\n1. Camera Quality\n2. Battery_Life\nRESULT [B]:\n1. Price Value\n"
+        return "1. Build_Quality\n2. Display_Quality"
+
+def test_batched_extraction():
+    """Concurrent submissions share one API call and fall back per excerpt."""
+    print("🧪 Testing Batched Keyword Extraction")
+    print("=" * 40)
+
+    extractor = StubExtractor()
+    batcher = BatchedExtractor(extractor, max_delay_ms=200)
+
+    futures = [
+        batcher.submit(f"Interview excerpt {i}", "Smartphones", service='openai', api_key='test-key')
+        for i in range(3)
+    ]
+    results = [future.result(timeout=10) for future in futures]
+
+    for result in results:
+        print(f"   • {result.message}: {result.keywords}")
+
+    assert all(result.success for result in results)
+    assert results[0].keywords == ['Camera_Quality', 'Battery_Life']
+    assert results[1].keywords == ['Price_Value']
+    assert results[2].keywords == ['Build_Quality', 'Display_Quality']
+
+    # One batched call plus one fallback call for the unanswered excerpt
+    assert len(extractor.prompts) == 2
+    print("✅ Batched extraction passed")
+
+def test_batches_do_not_mix_credentials():
+    """Requests with different API keys are never answered by the same call."""
+    print("\n🧪 Testing Credential Isolation in Batches")
+    print("=" * 40)
+
+    extractor = StubExtractor()
+    batcher = BatchedExtractor(extractor, max_delay_ms=200)
+
+    futures = [
+        batcher.submit("Interview excerpt", "Smartphones", service='openai', api_key=f'key-{i}')
+        for i in range(2)
+    ]
+    results = [future.result(timeout=10) for future in futures]
+
+    assert all(result.keywords == ['Build_Quality', 'Display_Quality'] for result in results)
+    assert not any('RESULT [' in prompt for prompt in extractor.prompts)
+    print("✅ Credential isolation passed")
+
+def test_repeated_extraction_is_cached():
+    """Identical input is served from the cache regardless of API key."""
+    print("\n🧪 Testing Keyword Cache")
+    print("=" * 40)
+
+    extractor = StubExtractor()
+    first = extractor.extract_keywords("Interview excerpt", "Smartphones", service='openai', api_key='key-1')
+    second = extractor.extract_keywords("Interview excerpt", "Smartphones", service='openai', api_key='key-2')
+    other = extractor.extract_keywords("Interview excerpt", "Smartphones", service='openai', api_key='key-1', max_keywords=5)
+
+    assert first.success and second.success and other.success
+    assert second.keywords == first.keywords
+    assert second.message.endswith('(cached)')
+    assert len(extractor.prompts) == 2
+
+    # Cached entries must not leak mutations back to callers
+    second.keywords.append('Mutated')
+    third = extractor.extract_keywords("Interview excerpt", "Smartphones", service='openai', api_key='key-3')
+    assert 'Mutated' not in third.keywords
+    print("✅ Keyword cache passed")
+
+if __name__ == "__main__":
+    test_batched_extraction()
+    test_batches_do_not_mix_credentials()
+    test_repeated_extraction_is_cached()
@@ -2,12 +2,36 @@
 """
 Quick test to verify map visibility fix
 """
-import requests
 import json
+import os
+import shutil
+from enhanced_upload_interface import app, MAPS_DIR
+
+def _list_files(directory):
+    """Names of the files in directory, empty if it does not exist."""
+    if not os.path.isdir(directory):
+        return set()
+    return {name for name in os.listdir(directory)
+            if os.path.isfile(os.path.join(directory, name))}
 
 def test_map_creation_and_visibility():
     """Test that maps can be created and are visible via the API."""
-    base_url = "http://localhost:8080"
+    # The app saves maps into results/maps/; remove whatever this run adds
+    # so test runs leave the checkout as they found it
+    maps_dir_existed = os.path.isdir(MAPS_DIR)
+    before = _list_files(MAPS_DIR)
+    try:
+        _check_map_endpoints()
+    finally:
+        for name in _list_files(MAPS_DIR) - before:
+            os.remove(os.path.join(MAPS_DIR, name))
+        if not maps_dir_existed:
+            shutil.rmtree(MAPS_DIR, ignore_errors=True)
+
+def _check_map_endpoints():
+    """Create a map, fetch it and list maps through the API."""
+    # In-process WSGI client: no server to start, no loopback TCP per request
+    client = app.test_client()
     
     # Test data - minimal example
     test_data = [
@@ -27,33 +51,39 @@ def test_map_creation_and_visibility():
         "quantitative_data": test_data
     }
     
-    response = requests.post(f"{base_url}/create_map", json=map_data)
+    response = client.post("/create_map", json=map_data)
     
     if response.status_code == 200:
-        result = response.json()
+        result = response.get_json()
         print(f"   ✅ Map created successfully: {result['message']}")
         print(f"   📁 File: {result['map_file']}")
         print(f"   🔗 URL: {result['map_url']}")
         
         # Test 2: Check if map is accessible
         print("\n2. Testing map accessibility...")
-        map_response = requests.get(f"{base_url}{result['map_url']}")
+        map_response = client.get(result['map_url'])
         
         if map_response.status_code == 200:
-            print(f"   ✅ Map accessible! Size: {len(map_response.content)} bytes")
+            # Size from the header when set, else count streamed chunks;
+            # either way the image is never buffered whole
+            size = map_response.content_length
+            if size is None:
+                size = sum(len(chunk) for chunk in map_response.iter_encoded())
+            print(f"   ✅ Map accessible! Size: {size} bytes")
         else:
             print(f"   ❌ Map not accessible: {map_response.status_code}")
+        map_response.close()
             
     else:
         print(f"   ❌ Map creation failed: {response.status_code}")
-        print(f"   Error: {response.text}")
+        print(f"   Error: {response.get_data(as_text=True)}")
     
     # Test 3: List all maps
     print("\n3. Listing all available maps...")
-    list_response = requests.get(f"{base_url}/list_maps")
+    list_response = client.get("/list_maps")
     
     if list_response.status_code == 200:
-        maps = list_response.json()['maps']
+        maps = list_response.get_json()['maps']
         print(f"   ✅ Found {len(maps)} total maps")
         for i, map_info in enumerate(maps[:3], 1):  # Show first 3
             print(f"   {i}. {map_info['filename']} - {map_info['created']}")
@@ -64,8 +94,5 @@ if __name__ == "__main__":
     try:
         test_map_creation_and_visibility()
         print("\n🎉 All tests completed!")
-    except requests.exceptions.ConnectionError:
-        print("❌ Cannot connect to Flask server at localhost:8080")
-        print("   Make sure the server is running with: python enhanced_upload_interface.py")
     except Exception as e:
         print(f"❌ Test failed with error: {e}")
\ No newline at end of file
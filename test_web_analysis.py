@@ -6,64 +6,129 @@ Test Web Analysis Endpoint
 Test the analysis generation endpoint to ensure it works properly.
 """
 
-import requests
 import json
+import functools
 import pandas as pd
+from enhanced_upload_interface import app
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# In-process WSGI client: requests never leave the process, so no server is needed
+client = app.test_client()
+
+SURVEY_PATH = 'test_large_survey.csv'
+
+# pd.read_csv's default NA strings and boolean spellings, so arrow's type
+# inference lands on the same values as the pandas path
+PANDAS_NA_VALUES = ['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+                    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None',
+                    'n/a', 'nan', 'null']
+
+def _read_columns(use_pyarrow):
+    """Parse the sample survey into {column: values}, as pd.read_csv would."""
+    if use_pyarrow:
+        # Multithreaded arrow parse, pinned to pandas' parsing rules
+        read_options = pacsv.ReadOptions(use_threads=True)
+        convert_options = pacsv.ConvertOptions(
+            null_values=PANDAS_NA_VALUES, strings_can_be_null=True,
+            true_values=['True', 'TRUE', 'true'], false_values=['False', 'FALSE', 'false'])
+        table = pacsv.read_csv(SURVEY_PATH, read_options=read_options,
+                               convert_options=convert_options)
+        # pandas leaves dates and times as strings; re-read any such column as text
+        temporal = {field.name: pa.string() for field in table.schema
+                    if pa.types.is_temporal(field.type)}
+        if temporal:
+            convert_options.column_types = temporal
+            table = pacsv.read_csv(SURVEY_PATH, read_options=read_options,
+                                   convert_options=convert_options)
+        df = table.to_pandas()
+        # Arrow string nulls come back as None where pandas has NaN
+        return {col: [float('nan') if v is None else v for v in values]
+                for col, values in df.to_dict('list').items()}
+    return pd.read_csv(SURVEY_PATH).to_dict('list')
+
+@functools.lru_cache(maxsize=None)
+def _load_columns():
+    """Parse the sample survey once per run into column lists (read-only).
+    
+    The endpoints build their DataFrame with pd.DataFrame(quantitative_data),
+    which takes {column: values} as readily as a list of row dicts, so the
+    payload skips building one dict per row.
+    """
+    return _read_columns(PYARROW_AVAILABLE)
+
+def test_column_loaders_agree():
+    """Test that the pyarrow and pandas survey loaders send the same payload."""
+    print("\n🔍 Testing Survey Loaders")
+    print("-" * 40)
+    
+    if not PYARROW_AVAILABLE:
+        print("⏭️  pyarrow not installed; only the pandas loader is in use")
+        return True
+    
+    try:
+        arrow_payload = json.dumps(_read_columns(True))
+        pandas_payload = json.dumps(_read_columns(False))
+    except Exception as e:
+        print(f"❌ Failed to load test data: {e}")
+        return False
+    
+    if arrow_payload == pandas_payload:
+        print("✅ pyarrow and pandas loaders produce identical payloads")
+        return True
+    print("❌ pyarrow and pandas loaders disagree")
+    return False
 
 def test_analysis_endpoint():
     """Test the analysis generation endpoint."""
     print("🧪 Testing Web Analysis Endpoint")
     print("=" * 40)
     
-    # Load test data
+    # Load test data, already in web format
     try:
-        df = pd.read_csv('test_large_survey.csv')
-        print(f"✅ Test data loaded: {len(df)} rows")
+        data_for_web = _load_columns()
+        print(f"✅ Test data loaded: {len(next(iter(data_for_web.values()), []))} rows")
     except Exception as e:
         print(f"❌ Failed to load test data: {e}")
         return False
     
-    # Convert to web format
-    data_for_web = df.to_dict('records')
-    
     # Test the analysis endpoint
-    url = "http://localhost:8080/generate_analysis"
+    url = "/generate_analysis"
     payload = {
         'quantitative_data': data_for_web
     }
     
     print(f"🌐 Testing analysis endpoint: {url}")
     
-    try:
-        response = requests.post(url, json=payload, timeout=10)
+    response = client.post(url, json=payload)
+    
+    if response.status_code == 200:
+        result = response.get_json()
         
-        if response.status_code == 200:
-            result = response.json()
+        if result.get('success'):
+            print(f"✅ Analysis generation successful!")
+            
+            summary = result.get('analysis_summary', {})
+            print(f"📊 Analysis Summary:")
+            print(f"   • Total products: {summary.get('total_products')}")
+            print(f"   • Dimensions: {len(summary.get('dimensions', []))}")
+            print(f"   • Possible maps: {summary.get('possible_maps')}")
+            print(f"   • Brands: {summary.get('brands')}")
+            
+            dimensions = result.get('available_dimensions', [])
+            print(f"📋 Available dimensions: {', '.join(dimensions)}")
             
-            if result.get('success'):
-                print(f"✅ Analysis generation successful!")
-                
-                summary = result.get('analysis_summary', {})
-                print(f"📊 Analysis Summary:")
-                print(f"   • Total products: {summary.get('total_products')}")
-                print(f"   • Dimensions: {len(summary.get('dimensions', []))}")
-                print(f"   • Possible maps: {summary.get('possible_maps')}")
-                print(f"   • Brands: {summary.get('brands')}")
-                
-                dimensions = result.get('available_dimensions', [])
-                print(f"📋 Available dimensions: {', '.join(dimensions)}")
-                
-                return True
-            else:
-                print(f"❌ Analysis failed: {result}")
-                return False
+            return True
         else:
-            print(f"❌ HTTP Error {response.status_code}: {response.text}")
+            print(f"❌ Analysis failed: {result}")
             return False
-            
-    except requests.exceptions.RequestException as e:
-        print(f"❌ Request failed: {e}")
-        print("   Make sure the Flask server is running at localhost:8080")
+    else:
+        print(f"❌ HTTP Error {response.status_code}: {response.get_data(as_text=True)}")
         return False
 
 def test_map_creation():
@@ -73,14 +138,13 @@ def test_map_creation():
     
     # Load test data
     try:
-        df = pd.read_csv('test_large_survey.csv')
-        data_for_web = df.to_dict('records')
+        data_for_web = _load_columns()
     except Exception as e:
         print(f"❌ Failed to load test data: {e}")
         return False
     
     # Test map creation
-    url = "http://localhost:8080/create_map"
+    url = "/create_map"
     payload = {
         'x_dimension': 'camera_quality',
         'y_dimension': 'price_value',
@@ -89,25 +153,20 @@ def test_map_creation():
     
     print(f"🌐 Testing map creation: camera_quality vs price_value")
     
-    try:
-        response = requests.post(url, json=payload, timeout=30)
+    response = client.post(url, json=payload)
+    
+    if response.status_code == 200:
+        result = response.get_json()
         
-        if response.status_code == 200:
-            result = response.json()
-            
-            if result.get('success'):
-                print(f"✅ Map creation successful!")
-                print(f"📁 Map file: {result.get('map_file')}")
-                return True
-            else:
-                print(f"❌ Map creation failed: {result}")
-                return False
+        if result.get('success'):
+            print(f"✅ Map creation successful!")
+            print(f"📁 Map file: {result.get('map_file')}")
+            return True
         else:
-            print(f"❌ HTTP Error {response.status_code}: {response.text}")
+            print(f"❌ Map creation failed: {result}")
             return False
-            
-    except requests.exceptions.RequestException as e:
-        print(f"❌ Request failed: {e}")
+    else:
+        print(f"❌ HTTP Error {response.status_code}: {response.get_data(as_text=True)}")
         return False
 
 def main():
@@ -115,21 +174,12 @@ def main():
     print("🧪 WEB ANALYSIS TEST SUITE")
     print("=" * 50)
     
-    # Check server availability
-    try:
-        response = requests.get("http://localhost:8080", timeout=5)
-        if response.status_code != 200:
-            print("❌ Server not responding properly")
-            return 1
-        print("✅ Server is running and responding")
-    except:
-        print("❌ Server not accessible at localhost:8080")
-        print("   Please start the server with: python enhanced_upload_interface.py")
-        return 1
-    
     # Run tests
     tests_passed = 0
-    tests_total = 2
+    tests_total = 3
+    
+    if test_column_loaders_agree():
+        tests_passed += 1
     
     if test_analysis_endpoint():
         tests_passed += 1
@@ -145,7 +195,7 @@ def main():
         print(f"🎉 All web analysis tests passed!")
         return 0
     else:
-        print(f"⚠️  Some tests failed. Check server logs.")
+        print(f"⚠️  Some tests failed. Check the errors above.")
         return 1
 
 if __name__ == "__main__":